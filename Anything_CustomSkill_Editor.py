@@ -7,16 +7,53 @@ import json
 import datetime
 import configparser
 import time
+import shutil
+import traceback
+import io
+import locale
+import atexit
+import functools
+import re
+from types import MappingProxyType
+from json.encoder import encode_basestring  # C-accelerated JSON string literal, non-ASCII kept as-is
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
-                               QMenuBar, QMenu, QFileDialog, QDialog, QTextEdit, QLineEdit, QFormLayout,
+                               QMenuBar, QMenu, QFileDialog, QDialog, QPlainTextEdit, QLineEdit, QFormLayout,
                                QCheckBox, QComboBox, QMessageBox, QToolBar, QStatusBar, QDockWidget, QTabWidget,
-                               QListWidget, QListWidgetItem)
-from PySide6.QtCore import Qt, QDateTime, QEvent
-from PySide6.QtGui import QFont, QIcon
+                               QListView, QToolTip, QGridLayout)
+from PySide6.QtCore import (Qt, QDateTime, QEvent, Signal, QObject, QRunnable, QThreadPool, QSignalBlocker, QUrl,
+                            QStringListModel, QTimer)
+from PySide6.QtGui import QFont, QIcon, QDesktopServices
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib codec is the fallback
+    orjson = None
+
+# orjson reads integers outside the 64-bit range as floats, so documents with a 19+ digit run
+# go through the stdlib parser, which keeps them exact
+_LONG_DIGITS_STR = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+def _json_loads(data):
+    """json.loads, sped up by orjson when it is installed; accepts exactly what json.loads accepts"""
+    if orjson is None:
+        return json.loads(data)
+    long_digits = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS_BYTES
+    if long_digits.search(data):
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # NaN, Infinity, 1e400 and the like are rejected by orjson but valid for json.loads
+        return json.loads(data)
+
+# Directory holding this script and its INI, stylesheet and icons
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 APP_CONFIG_FILE = "Anything_CustomSkill_Config.json"
 
-APP_CONFIG_DEFAULTS = {
+# Module-level defaults are read-only; take a dict() copy before changing anything
+APP_CONFIG_DEFAULTS = MappingProxyType({
     "log_level": "Standard",  # "Standard" or "Verbose"
     "default_skill_output_path": os.path.join(
         os.environ["APPDATA"], "AnythingLLM", "plugins", "agent-skills"
@@ -24,9 +61,9 @@ APP_CONFIG_DEFAULTS = {
     "lock_fields_by_default": True,
     "show_field_tooltips": True,
     "allow_skill_overwrite": False
-}
+})
 
-REVERSE_TEXT_SKILL_DEFAULTS = {
+REVERSE_TEXT_SKILL_DEFAULTS = MappingProxyType({
     "name": "Reverse Text",
     "hubId": "reverse-text",
     "description": "Takes a string input and returns the reversed version.",
@@ -35,9 +72,9 @@ REVERSE_TEXT_SKILL_DEFAULTS = {
     "output_description": "Returns the reversed string.",
     "version": "1.0.0",
     "schema": "skill-1.0.0"
-}
+})
 
-REVERSE_TEXT_SKILL_TOOLTIPS = {
+REVERSE_TEXT_SKILL_TOOLTIPS = MappingProxyType({
     "name": "Human-friendly name for the skill. This is what will show in the interface.",
     "hubId": "Internal skill ID. Must match the folder name exactly.",
     "description": "Short description of what the skill does. Used by the LLM to decide when to call it.",
@@ -46,92 +83,339 @@ REVERSE_TEXT_SKILL_TOOLTIPS = {
     "output_description": "What the skill returns. This must always be a string.",
     "version": "Version number for the skill, e.g., '1.0.0'.",
     "schema": "Must always be 'skill-1.0.0'. Required by AnythingLLM."
-}
+})
+
+# Appended to the entrypoint_file tooltip and shown on the Preview buttons
+ENTRYPOINT_FILE_TIP = "This file must live inside the same folder as plugin.json. Each skill has its own handler.js."
+
+def field_tooltip(key):
+    """Tooltip text for a skill form field"""
+    tip = REVERSE_TEXT_SKILL_TOOLTIPS.get(key, "")
+    if key == "entrypoint_file":
+        tip = f"{tip}\n{ENTRYPOINT_FILE_TIP}"
+    return tip
+
+# Whether verbose logging is on. The INI's [Logging] log_level is the only source: set at import
+# and refreshed when ConfigDialog saves it
+_VERBOSE_ENABLED = False
+
+def verbose_enabled():
+    """True when log_level is Verbose; check it before building expensive log messages"""
+    return _VERBOSE_ENABLED
+
+def _update_verbose_enabled(config):
+    global _VERBOSE_ENABLED
+    _VERBOSE_ENABLED = config.get("log_level", "Standard") == "Verbose"
 
 def load_app_config():
+    config = None
     if os.path.exists(APP_CONFIG_FILE):
         try:
-            with open(APP_CONFIG_FILE, "r") as f:
-                return json.load(f)
+            config = read_json_file(APP_CONFIG_FILE)
         except Exception as e:
             log_standard(f"Failed to load config: {e}")
-    return APP_CONFIG_DEFAULTS.copy()
+    if config is None:
+        config = dict(APP_CONFIG_DEFAULTS)
+    return config
+
+_CONFIG_CACHE = None
+_CONFIG_MTIME = None  # st_mtime_ns of the config file when _CONFIG_CACHE was read; None if it was missing
+
+def _config_mtime():
+    try:
+        return os.stat(APP_CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+def get_app_config():
+    """Return the app config, re-reading the file only when its mtime has changed"""
+    global _CONFIG_CACHE, _CONFIG_MTIME
+    mtime = _config_mtime()
+    if _CONFIG_CACHE is None or mtime != _CONFIG_MTIME:
+        _CONFIG_CACHE = load_app_config()
+        _CONFIG_MTIME = mtime
+    return _CONFIG_CACHE
+
+def invalidate_app_config():
+    """Drop the cached config so the next get_app_config() re-reads the file"""
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None
+
+def read_json_file(path):
+    """Parse a JSON file from one raw read; the bytes go to the parser without a text-decode pass"""
+    with open(path, "rb", buffering=65536) as f:
+        return _json_loads(f.read())
+
+def encode_pretty(obj):
+    """Indented JSON as UTF-8 bytes, with ': ' separators and non-ASCII kept as-is"""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:  # e.g. integers wider than 64 bits, which only the stdlib encoder takes
+            pass
+        else:
+            # orjson writes NaN and Infinity as null; any null goes through the stdlib encoder,
+            # which keeps them as NaN/Infinity the way json.loads read them
+            if b"null" not in encoded:
+                return encoded
+    return json.dumps(obj, indent=2, separators=(",", ": "), ensure_ascii=False).encode("utf-8")
+
+def dumps_pretty(obj):
+    """encode_pretty as text, for the previews"""
+    return encode_pretty(obj).decode("utf-8")
+
+# O_BINARY only exists on Windows, where leaving it out turns \n into \r\n
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+def write_file_atomic(path, data):
+    """Write bytes to path with raw os.write calls via a temp file, so a crash never leaves a partial file"""
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)  # Data must be on disk before the rename makes it visible
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+# Handler written when the Add dialog's preview area is left empty
+HANDLER_JS_TEMPLATE = b"""module.exports.runtime = {
+    handler: async function (params) {
+        const input = params.text || "";
+        const reversed = input.split("").reverse().join("");
+        return `Reversed: ${reversed}`;
+    }
+};"""
+
+# File dialogs skip symlink resolution and per-folder custom icons, which otherwise
+# stat every entry and make the dialog crawl when the skills path is on a network share
+_FILE_DIALOG_OPTIONS = QFileDialog.Option.DontResolveSymlinks | QFileDialog.Option.DontUseCustomDirectoryIcons
+_DIR_DIALOG_OPTIONS = QFileDialog.Option.ShowDirsOnly | _FILE_DIALOG_OPTIONS
+
+# Button styling lives in one application-wide stylesheet file loaded in main(),
+# so Qt parses it once instead of once per button instance. Buttons pick their
+# look through the "navKind" property and, optionally, their padding via "navSize".
+STYLESHEET_PATH = os.path.join(_MODULE_DIR, "Anything_CustomSkill_Editor.qss")
+
+def load_stylesheet():
+    """Read the application stylesheet, or return an empty sheet if the file is missing"""
+    try:
+        with open(STYLESHEET_PATH, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+_BUTTON_FONTS = {}
+
+def _button_font(point_size):
+    """Shared bold button font per point size, created on first use once a QApplication exists"""
+    font = _BUTTON_FONTS.get(point_size)
+    if font is None:
+        font = _BUTTON_FONTS[point_size] = QFont("Segoe UI", point_size, QFont.Bold)
+    return font
 
 class NavButton(QPushButton):
     """Navigation button class with glossy, pill-shaped black styling and sizing"""
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self.setMinimumSize(114, 33)  # Reduced by 5%
-        self.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        self.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 2px solid #222;
-                border-radius: 17px;
-                padding: 7px 28px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #444444, stop:0.5 #222222, stop:1 #000000
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #666666, stop:0.5 #333333, stop:1 #111111
-                );
-            }
-            QPushButton:pressed {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #222222, stop:1 #000000
-                );
-            }
-            QPushButton:disabled {
-                background: #222222;
-                color: #bbbbbb;
-                border: 2px solid #444444;
-            }
-        """)
+        self.setFont(_button_font(10))
+        self.setProperty("navKind", "pill")
 
 class MenuBarButton(QPushButton):
     """Menu bar button with rectangular styling and less-rounded corners"""
-    def __init__(self, text, parent=None):
+    nav_kind = "menu"  # Stylesheet rule set the button is drawn with
+
+    def __init__(self, text, parent=None, nav_size=None):
         super().__init__(text, parent)
         self.setMinimumSize(90, 28)  # Reduced by 10%
-        self.setFont(QFont("Segoe UI", 9, QFont.Bold))
-        self.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #222;
-                border-radius: 6px;
-                padding: 4px 15px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #444, stop:1 #222
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #666, stop:1 #333
-                );
-            }
-            QPushButton:pressed {
-                background: #222;
-            }
-            QPushButton:disabled {
-                background: #333;
-                color: #bbb;
-                border: 1.5px solid #444;
-            }
-        """)
+        self.setFont(_button_font(9))
+        self.setProperty("navKind", self.nav_kind)
+        if nav_size:
+            self.setProperty("navSize", nav_size)
+
+class BlueButton(MenuBarButton):
+    """Menu bar button for secondary actions (Clear Form, log tools)"""
+    nav_kind = "info"
+
+class RedButton(MenuBarButton):
+    """Menu bar button for Cancel/Close"""
+    nav_kind = "danger"
+
+class GreenButton(MenuBarButton):
+    """Menu bar button for the confirming action of a dialog"""
+    nav_kind = "confirm"
+
+class FieldInfoButton(QPushButton):
+    """Info button beside a form field; its tooltip text is only built when Qt asks to show it"""
+    def __init__(self, key, show_tooltip=True, parent=None):
+        super().__init__("ℹ️", parent)
+        self.setFixedWidth(28)
+        self.setProperty("fieldKey", key)
+        self._key = key
+        self._show_tooltip = show_tooltip
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip:
+            if self._show_tooltip:
+                QToolTip.showText(event.globalPos(), field_tooltip(self._key), self)
+            else:
+                QToolTip.hideText()
+            return True
+        return super().event(event)
+
+def make_preview_area(read_only=False):
+    """Unwrapped plain-text box for the plugin.json / handler.js previews"""
+    area = QPlainTextEdit()
+    area.setReadOnly(read_only)
+    area.setLineWrapMode(QPlainTextEdit.NoWrap)
+    area.setTabStopDistance(4 * area.fontMetrics().horizontalAdvance(" "))
+    area.setPlaceholderText("Preview of plugin.json will appear here...")
+    return area
+
+def make_field_grid():
+    """Label / field / info button grid for the skill forms; rows need no layout of their own"""
+    grid = QGridLayout()
+    grid.setColumnStretch(1, 1)
+    return grid
+
+def add_field_row(grid, row, key, field, info_btn):
+    grid.addWidget(QLabel(f"{key}:"), row, 0)
+    grid.addWidget(field, row, 1)
+    grid.addWidget(info_btn, row, 2)
+
+class FocusNotifyLineEdit(QLineEdit):
+    """Line edit that emits focused whenever it gains keyboard focus"""
+    focused = Signal()
+
+    def focusInEvent(self, event):
+        super().focusInEvent(event)
+        self.focused.emit()
+
+class SkillComboBox(QComboBox):
+    """Combo box that announces when its popup is about to open, so items can be loaded on demand"""
+    popupAboutToShow = Signal()
+
+    def showPopup(self):
+        self.popupAboutToShow.emit()
+        super().showPopup()
+
+_REQUIRED_PLUGIN_KEYS = frozenset(("name", "hubId", "description", "version", "schema"))
+# Quoted key names that must appear in the raw bytes before a plugin.json is worth parsing
+_REQUIRED_PLUGIN_KEY_BYTES = tuple(f'"{key}"'.encode() for key in _REQUIRED_PLUGIN_KEYS)
+# Anything bigger than this is not a real plugin.json and is skipped unparsed
+MAX_PLUGIN_JSON_BYTES = 64 * 1024
+
+# (skills_dir, directory st_mtime_ns, result) of the last scan. The directory mtime only
+# changes when folders are added or removed, so edits inside a skill folder must call
+# clear_skill_scan_cache() themselves.
+_SKILL_SCAN_CACHE = None
+
+# plugin.json path -> (st_mtime_ns, st_size, valid, description). Lets a rescan skip re-reading
+# folders whose plugin.json has not changed since it was last checked; scan_skills_dir drops
+# entries for folders that are gone.
+_PLUGIN_CHECK_CACHE = {}
+
+def clear_skill_scan_cache():
+    global _SKILL_SCAN_CACHE
+    _SKILL_SCAN_CACHE = None
+
+def _check_plugin_json(path):
+    """Description from a valid plugin.json at path, or None if it is missing, oversized or invalid"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    cached = _PLUGIN_CHECK_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[3] if cached[2] else None
+    valid = False
+    description = ""
+    if st.st_size <= MAX_PLUGIN_JSON_BYTES:
+        try:
+            with open(path, "rb") as f:
+                raw = f.read(MAX_PLUGIN_JSON_BYTES + 1)
+            # A substring scan is far cheaper than a parse, so files missing a key never reach the parser
+            if len(raw) <= MAX_PLUGIN_JSON_BYTES and all(key in raw for key in _REQUIRED_PLUGIN_KEY_BYTES):
+                pdata = _json_loads(raw)
+                if isinstance(pdata, dict) and pdata.keys() >= _REQUIRED_PLUGIN_KEYS:
+                    valid = True
+                    description = pdata["description"] or ""  # "description": null still lists the skill
+        except Exception:
+            pass
+    _PLUGIN_CHECK_CACHE[path] = (st.st_mtime_ns, st.st_size, valid, description)
+    return description if valid else None
+
+def scan_skills_dir(skills_dir):
+    """Return sorted (folder name, description) pairs for every valid skill folder in skills_dir"""
+    global _SKILL_SCAN_CACHE
+    try:
+        mtime = os.stat(skills_dir).st_mtime_ns
+    except OSError:
+        return []
+    cached = _SKILL_SCAN_CACHE
+    if cached is not None and cached[0] == skills_dir and cached[1] == mtime:
+        return cached[2]
+    skills = []
+    # One directory read; DirEntry.is_dir() reuses the entry type instead of a stat per child
+    try:
+        with os.scandir(skills_dir) as entries:
+            subdirs = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+    except OSError:
+        subdirs = []
+    seen = set()
+    for name, subdir_path in subdirs:
+        plugin_path = os.path.join(subdir_path, "plugin.json")
+        seen.add(plugin_path)
+        description = _check_plugin_json(plugin_path)
+        # Validate required fields and that the handler is present
+        if description is not None and os.path.isfile(os.path.join(subdir_path, "handler.js")):
+            skills.append((name, description))
+    for path in _PLUGIN_CHECK_CACHE.keys() - seen:
+        _PLUGIN_CHECK_CACHE.pop(path, None)
+    skills.sort(key=lambda skill: skill[0].lower())
+    _SKILL_SCAN_CACHE = (skills_dir, mtime, skills)
+    return skills
+
+class ScanDirTask(QRunnable):
+    """Scans the skills directory on a thread pool thread and reports plain data back; no widget access here"""
+    class Signals(QObject):
+        finished = Signal(list)
+
+    def __init__(self, skills_dir):
+        super().__init__()
+        self.skills_dir = skills_dir
+        self.signals = ScanDirTask.Signals()  # Created on the GUI thread so queued slots run there
+
+    def run(self):
+        self.signals.finished.emit(scan_skills_dir(self.skills_dir))
+
+class DeleteDirTask(QRunnable):
+    """Removes a skill folder on a thread pool thread; reports an error message, or "" on success"""
+    class Signals(QObject):
+        finished = Signal(str)
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = DeleteDirTask.Signals()  # Created on the GUI thread so queued slots run there
+
+    def run(self):
+        try:
+            shutil.rmtree(self.path)
+            error = ""
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        self.signals.finished.emit(error)
 
 # INI file handling
+INI_PATH = os.path.join(_MODULE_DIR, "Anything_CustomSkill_Editor.ini")
+
 def load_ini_config():
     config = configparser.ConfigParser(interpolation=None)  # Disable interpolation
-    ini_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Anything_CustomSkill_Editor.ini")
+    ini_path = INI_PATH
     
     # Create default INI if it doesn't exist
     if not os.path.exists(ini_path):
@@ -157,9 +441,8 @@ def load_ini_config():
         }
         
         # Create icons directory if it doesn't exist
-        icons_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons')
-        if not os.path.exists(icons_dir):
-            os.makedirs(icons_dir)
+        icons_dir = os.path.join(_MODULE_DIR, 'icons')
+        os.makedirs(icons_dir, exist_ok=True)
         
         with open(ini_path, 'w') as f:
             config.write(f)
@@ -173,31 +456,70 @@ def expand_path(path):
         path = path.replace('{APPDATA}', os.environ.get('APPDATA', ''))
     return path
 
-# Get INI config
+# Options stored as "true"/"false" that readers want as bools
+_INI_BOOLEAN_OPTIONS = {"SkillDefaults": ("lock_fields", "show_tooltips", "allow_overwrite")}
+
+def snapshot_ini(config):
+    """Plain nested-dict copy of a ConfigParser with boolean options already converted"""
+    ini = {section: dict(config[section]) for section in config.sections()}
+    for section, options in _INI_BOOLEAN_OPTIONS.items():
+        for option in options:
+            if option in ini.get(section, ()):
+                ini[section][option] = config[section].getboolean(option)
+    return ini
+
+def refresh_ini():
+    """Rebuild INI after INI_CONFIG has been changed"""
+    global INI
+    INI = snapshot_ini(INI_CONFIG)
+
+def save_ini():
+    """Atomically write INI_CONFIG back to disk and refresh the INI snapshot"""
+    buf = io.StringIO()
+    INI_CONFIG.write(buf)
+    # Same encoding open() uses by default, which is what configparser reads with
+    write_file_atomic(INI_PATH, buf.getvalue().encode(locale.getpreferredencoding(False)))
+    refresh_ini()
+
+# Get INI config. INI_CONFIG is the live parser used for saving; reads go through the INI snapshot
 INI_CONFIG = load_ini_config()
+INI = snapshot_ini(INI_CONFIG)
+# Seed the verbose flag from the INI so it is right before the JSON config is first read
+_update_verbose_enabled(INI['Logging'])
 
 # Update constants based on INI
-APP_CONFIG_FILE = INI_CONFIG['Paths']['config_file']
-LOG_DIR = os.path.expanduser(f"~/{INI_CONFIG['Paths']['log_directory']}")
-LOG_FILE_STANDARD = os.path.join(LOG_DIR, INI_CONFIG['Logging']['standard_log'])
-LOG_FILE_VERBOSE = os.path.join(LOG_DIR, INI_CONFIG['Logging']['verbose_log'])
-
-# Icon handling
+APP_CONFIG_FILE = INI['Paths']['config_file']
+LOG_DIR = os.path.expanduser(f"~/{INI['Paths']['log_directory']}")
+LOG_FILE_STANDARD = os.path.join(LOG_DIR, INI['Logging']['standard_log'])
+LOG_FILE_VERBOSE = os.path.join(LOG_DIR, INI['Logging']['verbose_log'])
+os.makedirs(LOG_DIR, exist_ok=True)
+
+# Icon handling. main() sets the icon on the QApplication once and every window inherits it
+@functools.lru_cache(maxsize=8)
+def _load_icon(path, mtime_ns, size):
+    """QIcon for an icon file, decoded once per path and file version"""
+    return QIcon(path)
+
+@functools.lru_cache(maxsize=1)
 def get_app_icon():
-    icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                            INI_CONFIG['Paths']['icon_path'])
-    if os.path.exists(icon_path):
-        return QIcon(icon_path)
-    return None
+    """Decode the configured icon file once; call get_app_icon.cache_clear() after changing it"""
+    icon_path = os.path.join(_MODULE_DIR, INI['Paths']['icon_path'])
+    try:
+        st = os.stat(icon_path)
+    except OSError:
+        return None
+    return _load_icon(icon_path, st.st_mtime_ns, st.st_size)
+
+SKILL_DROPDOWN_PLACEHOLDER = "Load Existing Skill"
 
-LOG_DIR = os.path.expanduser("~/Documents/AnythingCustomSkillLogs")
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
+# Bound str.format, so building the message for a missing field is a single C call
+_EMPTY_FIELD_MSG = "'{}' cannot be empty.".format
 
-LOG_FILE_STANDARD = os.path.join(LOG_DIR, "custom_skill_log_standard.txt")
-LOG_FILE_VERBOSE = os.path.join(LOG_DIR, "custom_skill_log_verbose.txt")
+# Buttons for the Create/Update confirmations, combined once instead of on every prompt
+_YES_NO = QMessageBox.Yes | QMessageBox.No
+_YES = QMessageBox.Yes
 
-REQUIRED_FIELDS = {
+REQUIRED_FIELDS = MappingProxyType({
     "name": "The user-friendly name of the skill.",
     "hubId": "Internal skill ID. Must match folder name.",
     "description": "Short summary of what the skill does.",
@@ -206,30 +528,65 @@ REQUIRED_FIELDS = {
     "output_description": "What the skill will return. Must be a string.",
     "version": "Version of the skill, e.g., '1.0.0'.",
     "schema": "Must always be 'skill-1.0.0'."
-}
+})
+_REQUIRED_FIELD_ORDER = tuple(REQUIRED_FIELDS)
+_REQUIRED_ITEMS = tuple(REQUIRED_FIELDS.items())
+# Fields update_skill requires directly on the plugin.json object (the rest live under "entrypoint")
+_TOP_LEVEL_REQUIRED_KEYS = ("name", "hubId", "description", "version", "schema")
+
+# Log actions shared by the Tools menu and the configuration dialog
+def _review_log(parent):
+    log_file = LOG_FILE_VERBOSE if verbose_enabled() else LOG_FILE_STANDARD
+    try:
+        flush_logs()
+        if not os.path.exists(log_file):
+            QMessageBox.information(parent, "Log Not Found", "No log file found.")
+            return
+        # Hand the file to the desktop's default viewer without waiting on the shell
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(log_file)):
+            QMessageBox.critical(parent, "Error", f"Could not open log file:\n{log_file}")
+    except Exception as e:
+        QMessageBox.critical(parent, "Error", f"Could not open log file:\n{e}")
+
+def _clear_log(parent):
+    try:
+        truncate_log(LOG_FILE_STANDARD)
+        QMessageBox.information(parent, "Log Cleared", "Log file has been cleared.")
+    except Exception as e:
+        QMessageBox.critical(parent, "Error", f"Could not clear log file:\n{e}")
+
+def _backup_log(parent):
+    try:
+        flush_logs()
+        if not os.path.exists(LOG_FILE_STANDARD):
+            QMessageBox.information(parent, "Log Not Found", "No log file found.")
+            return
+        downloads = os.path.join(os.path.expanduser("~"), "Downloads")
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_name = f"custom_skill_log_standard_{timestamp}.txt"
+        backup_path = os.path.join(downloads, backup_name)
+        shutil.copy(LOG_FILE_STANDARD, backup_path)
+        QMessageBox.information(parent, "Log Backed Up", f"Log file backed up to:\n{backup_path}")
+    except Exception as e:
+        QMessageBox.critical(parent, "Error", f"Could not back up log file:\n{e}")
 
 class ConfigDialog(QDialog):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("App Configuration")
         self.resize(400, 350)
-        
-        # Set dialog icon if available
-        app_icon = get_app_icon()
-        if app_icon:
-            self.setWindowIcon(app_icon)
 
         self.layout = QFormLayout()
 
         # log_level dropdown
         self.log_level_combo = QComboBox()
         self.log_level_combo.addItems(["Standard", "Verbose"])
-        self.log_level_combo.setCurrentText(INI_CONFIG['Logging']['log_level'])
+        self.log_level_combo.setCurrentText(INI['Logging']['log_level'])
         self.layout.addRow("Log Level:", self.log_level_combo)
 
         # default_skill_output_path with browse
         path_layout = QHBoxLayout()
-        self.path_edit = QLineEdit(expand_path(INI_CONFIG['SkillDefaults']['output_path']))
+        self.path_edit = QLineEdit(expand_path(INI['SkillDefaults']['output_path']))
         browse_btn = MenuBarButton("Browse")
         browse_btn.clicked.connect(self.browse_path)
         path_layout.addWidget(self.path_edit)
@@ -240,56 +597,27 @@ class ConfigDialog(QDialog):
 
         # lock_fields_by_default
         self.lock_fields_cb = QCheckBox("Lock fields by default")
-        self.lock_fields_cb.setChecked(INI_CONFIG['SkillDefaults'].getboolean('lock_fields'))
+        self.lock_fields_cb.setChecked(INI['SkillDefaults']['lock_fields'])
         self.layout.addRow(self.lock_fields_cb)
 
         # show_field_tooltips
         self.tooltips_cb = QCheckBox("Show field tooltips")
-        self.tooltips_cb.setChecked(INI_CONFIG['SkillDefaults'].getboolean('show_tooltips'))
+        self.tooltips_cb.setChecked(INI['SkillDefaults']['show_tooltips'])
         self.layout.addRow(self.tooltips_cb)
 
         # allow_skill_overwrite
         self.overwrite_cb = QCheckBox("Allow skill overwrite")
-        self.overwrite_cb.setChecked(INI_CONFIG['SkillDefaults'].getboolean('allow_overwrite'))
+        self.overwrite_cb.setChecked(INI['SkillDefaults']['allow_overwrite'])
         self.layout.addRow(self.overwrite_cb)
 
         # Log management buttons
         log_btn_layout = QHBoxLayout()
-        review_log_btn = MenuBarButton("Review Log")
-        review_log_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #0057b8;
-                border-radius: 6px;
-                padding: 4px 15px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3399ff, stop:1 #0057b8
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #66b3ff, stop:1 #0073e6
-                );
-            }
-            QPushButton:pressed {
-                background: #0057b8;
-            }
-            QPushButton:disabled {
-                background: #0057b8;
-                color: #bbbbbb;
-                border: 1.5px solid #0057b8;
-            }
-        """)
-        review_log_btn.clicked.connect(self.review_log)
-        clear_log_btn = MenuBarButton("Clear Log File")
-        clear_log_btn.setStyleSheet(review_log_btn.styleSheet())
-        clear_log_btn.clicked.connect(self.clear_log)
-        backup_log_btn = MenuBarButton("Back Up Log File")
-        backup_log_btn.setStyleSheet(review_log_btn.styleSheet())
-        backup_log_btn.clicked.connect(self.backup_log)
+        review_log_btn = BlueButton("Review Log", nav_size="compact")
+        review_log_btn.clicked.connect(functools.partial(_review_log, self))
+        clear_log_btn = BlueButton("Clear Log File", nav_size="compact")
+        clear_log_btn.clicked.connect(functools.partial(_clear_log, self))
+        backup_log_btn = BlueButton("Back Up Log File", nav_size="compact")
+        backup_log_btn.clicked.connect(functools.partial(_backup_log, self))
         log_btn_layout.addWidget(review_log_btn)
         log_btn_layout.addWidget(clear_log_btn)
         log_btn_layout.addWidget(backup_log_btn)
@@ -299,34 +627,7 @@ class ConfigDialog(QDialog):
         btn_layout = QHBoxLayout()
         save_btn = MenuBarButton("Save")
         save_btn.clicked.connect(self.save_config)
-        cancel_btn = MenuBarButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #a00;
-                border-radius: 6px;
-                padding: 4px 15px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff4444, stop:1 #a00000
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6666, stop:1 #c00000
-                );
-            }
-            QPushButton:pressed {
-                background: #a00000;
-            }
-            QPushButton:disabled {
-                background: #a00000;
-                color: #bbbbbb;
-                border: 1.5px solid #a00000;
-            }
-        """)
+        cancel_btn = RedButton("Cancel", nav_size="compact")
         cancel_btn.clicked.connect(self.reject)
         btn_layout.addWidget(save_btn)
         btn_layout.addWidget(cancel_btn)
@@ -335,11 +636,11 @@ class ConfigDialog(QDialog):
 
     def browse_path(self):
         # Expand environment variables and ensure the directory exists
-        default_path = os.path.expandvars(INI_CONFIG['SkillDefaults']['output_path'])
+        default_path = os.path.expandvars(INI['SkillDefaults']['output_path'])
         default_path = os.path.abspath(default_path)
-        if not os.path.exists(default_path):
-            os.makedirs(default_path)
-        path = QFileDialog.getExistingDirectory(self, "Select Skill Output Directory", default_path)
+        os.makedirs(default_path, exist_ok=True)
+        path = QFileDialog.getExistingDirectory(self, "Select Skill Output Directory", default_path,
+                                                _DIR_DIALOG_OPTIONS)
         if path:
             self.path_edit.setText(path)
 
@@ -366,76 +667,37 @@ class ConfigDialog(QDialog):
             INI_CONFIG['SkillDefaults']['lock_fields'] = str(config['lock_fields_by_default']).lower()
             INI_CONFIG['SkillDefaults']['show_tooltips'] = str(config['show_field_tooltips']).lower()
             INI_CONFIG['SkillDefaults']['allow_overwrite'] = str(config['allow_skill_overwrite']).lower()
-            with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                                 "Anything_CustomSkill_Editor.ini"), 'w') as f:
-                INI_CONFIG.write(f)
+            save_ini()
+            _update_verbose_enabled(INI['Logging'])
 
             # Update JSON config
-            with open(APP_CONFIG_FILE, "w") as f:
-                json.dump(config, f, indent=2)
+            write_file_atomic(APP_CONFIG_FILE, encode_pretty(config))
+            invalidate_app_config()
             
             log_standard(f"Config saved: {json.dumps(config)}")
             QMessageBox.information(self, "Saved", "Configuration saved to disk.")
             self.accept()
         except Exception as e:
-            QMessageBox.critical(self, "File Error", f"Failed to save configuration.\n{str(e)}")
-
-    def review_log(self):
-        config = load_app_config()
-        log_level = config.get("log_level", "Standard")
-        log_file = LOG_FILE_STANDARD if log_level == "Standard" else LOG_FILE_VERBOSE
-        try:
-            if not os.path.exists(log_file):
-                QMessageBox.information(self, "Log Not Found", "No log file found.")
-                return
-            os.startfile(log_file)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not open log file:\n{e}")
-
-    def clear_log(self):
-        try:
-            with open(LOG_FILE_STANDARD, "w") as f:
-                f.write("")
-            QMessageBox.information(self, "Log Cleared", "Log file has been cleared.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not clear log file:\n{e}")
-
-    def backup_log(self):
-        try:
-            if not os.path.exists(LOG_FILE_STANDARD):
-                QMessageBox.information(self, "Log Not Found", "No log file found.")
-                return
-            import shutil
-            import datetime
-            downloads = os.path.join(os.path.expanduser("~"), "Downloads")
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"custom_skill_log_standard_{timestamp}.txt"
-            backup_path = os.path.join(downloads, backup_name)
-            shutil.copy(LOG_FILE_STANDARD, backup_path)
-            QMessageBox.information(self, "Log Backed Up", f"Log file backed up to:\n{backup_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not back up log file:\n{e}")
+            QMessageBox.critical(self, "File Error", f"Failed to save configuration.\n{e}")
 
 class SkillEditor(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.setWindowTitle(INI_CONFIG['Appearance']['window_title'])
+        self.setWindowTitle(INI['Appearance']['window_title'])
         self.setMinimumSize(800, 600)
-        
-        # Set application icon
-        app_icon = get_app_icon()
-        if app_icon:
-            self.setWindowIcon(app_icon)
-            QApplication.setWindowIcon(app_icon)
 
         self.add_btn = None  # Reference to Add New button
         self.modify_btn = None
         self.delete_btn = None
         self.skill_loaded_label = None  # Indicator label
+        self._skills_loaded = False  # Set once a scan of the skills directory has filled the dropdown
+        self._scan_task = None  # ScanDirTask currently running, if any
         self.init_ui()
+        # Scan once the event loop is running, so the window shows first and the dropdown
+        # is filled for keyboard and wheel users too, not only when its popup opens
+        QTimer.singleShot(0, self.ensure_skills_loaded)
         # Log app start
-        config = load_app_config()
-        if config.get("log_level", "Standard") == "Verbose":
+        if verbose_enabled():
             log_verbose("App started", action="App Start")
 
     def init_ui(self):
@@ -447,6 +709,16 @@ class SkillEditor(QMainWindow):
         tools_menu_btn.clicked.connect(self.open_tools_menu)
         toolbar.addWidget(tools_menu_btn)
 
+        # Tools menu is built once here and re-shown on each click
+        self.tools_menu = QMenu(self)
+        self.tools_menu.addAction("Review Log", functools.partial(_review_log, self))
+        self.tools_menu.addAction("Clear Log File", functools.partial(_clear_log, self))
+        self.tools_menu.addAction("Back Up Log File", functools.partial(_backup_log, self))
+        self.tools_menu.addSeparator()
+        self.tools_menu.addAction("Change Icon", self.open_icon_dialog)
+        self.tools_menu.addSeparator()
+        self.tools_menu.addAction("Configuration", self.open_config_dialog)
+
         # Nav Buttons (centered)
         nav_layout = QHBoxLayout()
         for label in ["Add New", "Modify Skill", "Delete Skill"]:
@@ -468,15 +740,16 @@ class SkillEditor(QMainWindow):
         # Skill loaded label (hidden by default)
         self.skill_loaded_label = QLabel("Skill Loaded")
         self.skill_loaded_label.setAlignment(Qt.AlignCenter)
-        self.skill_loaded_label.setStyleSheet("font-size: 48px; color: #1ec41e; font-weight: bold;")
+        self.skill_loaded_label.setObjectName("skillLoadedLabel")
         self.skill_loaded_label.setVisible(False)
         center_layout.addWidget(self.skill_loaded_label)
         center_layout.addWidget(nav_widget, alignment=Qt.AlignHCenter)
 
         # Skill folders dropdown
-        self.skill_dropdown = QComboBox()
+        self.skill_dropdown = SkillComboBox()
         self.skill_dropdown.setFixedWidth(320)  # 4x typical default width (80px)
-        self.populate_skill_dropdown()
+        self.skill_dropdown.addItem(SKILL_DROPDOWN_PLACEHOLDER)
+        self.skill_dropdown.popupAboutToShow.connect(self.ensure_skills_loaded)
         dropdown_widget = QWidget()
         dropdown_layout = QHBoxLayout()
         dropdown_layout.addStretch()
@@ -499,34 +772,7 @@ class SkillEditor(QMainWindow):
         # Close button layout (lower right)
         close_btn_layout = QHBoxLayout()
         close_btn_layout.addStretch()
-        close_btn = MenuBarButton("Close")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #a00;
-                border-radius: 6px;
-                padding: 6px 18px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff4444, stop:1 #a00000
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6666, stop:1 #c00000
-                );
-            }
-            QPushButton:pressed {
-                background: #a00000;
-            }
-            QPushButton:disabled {
-                background: #a00000;
-                color: #bbbbbb;
-                border: 1.5px solid #a00000;
-            }
-        """)
+        close_btn = RedButton("Close")
         close_btn.clicked.connect(self.close)
         close_btn_layout.addWidget(close_btn)
         main_layout.addLayout(close_btn_layout)
@@ -540,8 +786,7 @@ class SkillEditor(QMainWindow):
 
         self.skill_dropdown.currentIndexChanged.connect(self.on_skill_selected)
         # Log UI init
-        config = load_app_config()
-        if config.get("log_level", "Standard") == "Verbose":
+        if verbose_enabled():
             log_verbose("Main window UI initialized", action="UI Init")
 
         # Ensure correct initial button states
@@ -553,111 +798,114 @@ class SkillEditor(QMainWindow):
             self.add_btn.setEnabled(True)
 
     def populate_skill_dropdown(self):
-        self.skill_dropdown.clear()
-        # Add placeholder item
-        self.skill_dropdown.addItem("Load Existing Skill")
-        config = load_app_config()
-        skills_dir = config.get("default_skill_output_path", "")
-        valid_subdirs = []
-        descriptions = {}
-        if os.path.isdir(skills_dir):
-            for name in os.listdir(skills_dir):
-                subdir_path = os.path.join(skills_dir, name)
-                if os.path.isdir(subdir_path):
-                    plugin_json = os.path.join(subdir_path, "plugin.json")
-                    handler_js = os.path.join(subdir_path, "handler.js")
-                    if os.path.isfile(plugin_json) and os.path.isfile(handler_js):
-                        try:
-                            # Validate plugin.json is valid JSON
-                            with open(plugin_json, "r", encoding="utf-8") as f:
-                                pdata = json.load(f)
-                                # Validate required fields
-                                if all(key in pdata for key in ["name", "hubId", "description", "version", "schema"]):
-                                    valid_subdirs.append(name)
-                                    desc = pdata.get("description", "")
-                                    descriptions[name] = desc
-                        except Exception:
-                            continue
-        for subdir in sorted(valid_subdirs, key=lambda s: s.lower()):
-            self.skill_dropdown.addItem(subdir)
-            idx = self.skill_dropdown.findText(subdir)
-            if idx >= 0:
-                self.skill_dropdown.setItemData(idx, descriptions.get(subdir, ""), Qt.ToolTipRole)
+        """Start a background scan of the skills directory; the dropdown fills in when it finishes"""
+        if self._scan_task is not None:
+            return
+        config = get_app_config()
+        task = ScanDirTask(config.get("default_skill_output_path", ""))
+        task.signals.finished.connect(self._apply_skill_list, Qt.QueuedConnection)
+        self._scan_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _apply_skill_list(self, skills):
+        if self._scan_task is None or self.sender() is not self._scan_task.signals:
+            return  # Dropdown was invalidated while this scan was running
+        self._scan_task = None
+        # Rebuild in one batch with signals and repaints held off
+        dropdown = self.skill_dropdown
+        with QSignalBlocker(dropdown):
+            dropdown.setUpdatesEnabled(False)
+            try:
+                dropdown.clear()
+                # Add placeholder item
+                dropdown.addItem(SKILL_DROPDOWN_PLACEHOLDER)
+                dropdown.addItems([name for name, _ in skills])
+                for idx, (_, desc) in enumerate(skills, start=1):
+                    dropdown.setItemData(idx, desc, Qt.ToolTipRole)
+            finally:
+                dropdown.setUpdatesEnabled(True)
+        self._skills_loaded = True
+        # No selection signal fired during the rebuild, so reset the selection state here
+        self.reset_ui_after_save()
+        if dropdown.view().isVisible():
+            # The popup was laid out for the placeholder alone; reopen it at the new size
+            dropdown.hidePopup()
+            dropdown.showPopup()
+
+    def ensure_skills_loaded(self):
+        if not self._skills_loaded:
+            self.populate_skill_dropdown()
+
+    def invalidate_skill_dropdown(self):
+        """Drop the listed skills and rescan the skills directory in the background"""
+        self._skills_loaded = False
+        self._scan_task = None  # Results of a scan still in flight are discarded
+        clear_skill_scan_cache()
+        dropdown = self.skill_dropdown
+        with QSignalBlocker(dropdown):
+            dropdown.clear()
+            dropdown.addItem(SKILL_DROPDOWN_PLACEHOLDER)
+        self.reset_ui_after_save()
+        self.populate_skill_dropdown()
 
     def open_tools_menu(self):
-        config = load_app_config()
-        if config.get("log_level", "Standard") == "Verbose":
+        if verbose_enabled():
             log_verbose("Tools menu opened", action="Menu Open")
-        self.tools_menu = QMenu()
-        self.tools_menu.addAction("Review Log", self.review_log)
-        self.tools_menu.addAction("Clear Log File", self.clear_log)
-        self.tools_menu.addAction("Back Up Log File", self.backup_log)
-        self.tools_menu.addSeparator()
-        self.tools_menu.addAction("Change Icon", self.open_icon_dialog)
-        self.tools_menu.addSeparator()
-        self.tools_menu.addAction("Configuration", self.open_config_dialog)
-        self.tools_menu.exec(self.sender().mapToGlobal(self.sender().rect().bottomLeft()))
+        button = self.sender()
+        self.tools_menu.exec(button.mapToGlobal(button.rect().bottomLeft()))
 
     def placeholder_popup(self):
-        sender = self.sender()
-        config = load_app_config()
-        if config.get("log_level", "Standard") == "Verbose":
-            log_verbose(f"Button clicked: {sender.text()}", action="Button Click")
-        if sender.text() == "Add New":
-            if config.get("log_level", "Standard") == "Verbose":
+        label = self.sender().text()
+        if verbose_enabled():
+            log_verbose(f"Button clicked: {label}", action="Button Click")
+        if label == "Add New":
+            if verbose_enabled():
                 log_verbose("AddSkillDialog opened", action="Dialog Open")
             dialog = AddSkillDialog(self)
             dialog.exec()
-            # After adding, repopulate dropdown and hide loaded label
-            self.populate_skill_dropdown()
-            self.show_skill_loaded(False)
-        elif sender.text() == "Modify Skill":
-            if config.get("log_level", "Standard") == "Verbose":
-                log_verbose("ModifySkillDialog opened", action="Dialog Open", skill_data={"skill": self.skill_dropdown.currentText()})
-            dialog = ModifySkillDialog(self.skill_dropdown.currentText(), self)
+            # After adding, refresh dropdown and hide loaded label
+            self.invalidate_skill_dropdown()
+        elif label == "Modify Skill":
+            skill_name = self.skill_dropdown.currentText()
+            if verbose_enabled():
+                log_verbose("ModifySkillDialog opened", action="Dialog Open", skill_data={"skill": skill_name})
+            dialog = ModifySkillDialog(skill_name, self)
             if dialog.exec() == QDialog.Accepted:
-                self.populate_skill_dropdown()
-                self.reset_ui_after_save()
-        elif sender.text() == "Delete Skill":
-            if config.get("log_level", "Standard") == "Verbose":
-                log_verbose("DeleteSkillDialog opened", action="Dialog Open", skill_data={"skill": self.skill_dropdown.currentText()})
-            dialog = DeleteSkillDialog(self.skill_dropdown.currentText(), self)
+                self.invalidate_skill_dropdown()
+        elif label == "Delete Skill":
+            skill_name = self.skill_dropdown.currentText()
+            if verbose_enabled():
+                log_verbose("DeleteSkillDialog opened", action="Dialog Open", skill_data={"skill": skill_name})
+            dialog = DeleteSkillDialog(skill_name, self)
             if dialog.exec() == QDialog.Accepted:
-                self.populate_skill_dropdown()
-                self.show_skill_loaded(False)
+                self.invalidate_skill_dropdown()
         else:
             QMessageBox.information(self, "Coming Soon", "This function is not yet implemented.")
 
     def on_skill_selected(self, idx):
-        config = load_app_config()
-        if config.get("log_level", "Standard") == "Verbose":
+        if verbose_enabled():
             log_verbose(f"Dropdown selection changed: {self.skill_dropdown.currentText()}", action="Dropdown Change")
         # Only trigger if not the placeholder
         if idx > 0:
             skill_name = self.skill_dropdown.currentText()
-            config = load_app_config()
+            config = get_app_config()
             skills_dir = config.get("default_skill_output_path", "")
             skill_folder = os.path.join(skills_dir, skill_name)
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 dialog = LoadSkillDialog(skill_folder, self)
                 result = dialog.exec()
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 if result == QDialog.Accepted:
                     if self.modify_btn:
                         self.modify_btn.setEnabled(True)
                     if self.delete_btn:
                         self.delete_btn.setEnabled(True)
                     # Verbose logging
-                    if config.get("log_level", "Standard") == "Verbose":
-                        try:
-                            with open(os.path.join(skill_folder, "plugin.json"), "r", encoding="utf-8") as f:
-                                plugin_data = json.load(f)
-                        except Exception as e:
-                            plugin_data = {"error": str(e)}
+                    if verbose_enabled():
                         log_verbose(
                             message="Skill loaded successfully.",
-                            skill_data=plugin_data,
+                            skill_data=dialog.loaded_plugin_data or {},
                             action="Skill Load",
                             duration=duration
                         )
@@ -669,7 +917,7 @@ class SkillEditor(QMainWindow):
                         self.delete_btn.setEnabled(False)
                     self.show_skill_loaded(False)
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 log_verbose(
                     message="Error during skill load.",
                     skill_data={"skill_name": skill_name},
@@ -693,45 +941,11 @@ class SkillEditor(QMainWindow):
         dialog = IconDialog(self)
         dialog.exec()
 
-    def review_log(self):
-        config = load_app_config()
-        log_level = config.get("log_level", "Standard")
-        log_file = LOG_FILE_STANDARD if log_level == "Standard" else LOG_FILE_VERBOSE
-        try:
-            if not os.path.exists(log_file):
-                QMessageBox.information(self, "Log Not Found", "No log file found.")
-                return
-            os.startfile(log_file)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not open log file:\n{e}")
-
-    def clear_log(self):
-        try:
-            with open(LOG_FILE_STANDARD, "w") as f:
-                f.write("")
-            QMessageBox.information(self, "Log Cleared", "Log file has been cleared.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not clear log file:\n{e}")
-
-    def backup_log(self):
-        try:
-            if not os.path.exists(LOG_FILE_STANDARD):
-                QMessageBox.information(self, "Log Not Found", "No log file found.")
-                return
-            import shutil
-            import datetime
-            downloads = os.path.join(os.path.expanduser("~"), "Downloads")
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"custom_skill_log_standard_{timestamp}.txt"
-            backup_path = os.path.join(downloads, backup_name)
-            shutil.copy(LOG_FILE_STANDARD, backup_path)
-            QMessageBox.information(self, "Log Backed Up", f"Log file backed up to:\n{backup_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not back up log file:\n{e}")
-
     def open_config_dialog(self):
         dialog = ConfigDialog()
-        dialog.exec()
+        if dialog.exec() == QDialog.Accepted:
+            # The skills output path may have changed
+            self.invalidate_skill_dropdown()
 
     def reset_ui_after_save(self):
         self.show_skill_loaded(False)
@@ -742,56 +956,84 @@ class SkillEditor(QMainWindow):
         if self.skill_dropdown:
             self.skill_dropdown.setCurrentIndex(0)
 
+def build_plugin_dict(data, params):
+    """plugin.json content for the flattened form fields in data, with params already parsed"""
+    return {
+        "active": True,
+        "hubId": data["hubId"],
+        "name": data["name"],
+        "schema": data["schema"],
+        "version": data["version"],
+        "description": data["description"],
+        "output_description": data["output_description"],
+        "entrypoint": {
+            "file": data["entrypoint_file"],
+            "params": params
+        }
+    }
+
+# dumps_pretty(build_plugin_dict(...)) with the fixed layout spelled out; %s slots take JSON literals
+_PLUGIN_JSON_TEMPLATE = """{
+  "active": true,
+  "hubId": %s,
+  "name": %s,
+  "schema": %s,
+  "version": %s,
+  "description": %s,
+  "output_description": %s,
+  "entrypoint": {
+    "file": %s,
+    "params": %s
+  }
+}"""
+_PLUGIN_TEMPLATE_KEYS = ("hubId", "name", "schema", "version", "description", "output_description",
+                         "entrypoint_file")
+
+def preview_plugin_json(data, params):
+    """Preview text for plugin.json; only params goes through the (pure-Python, indenting) JSON encoder"""
+    values = [data[key] for key in _PLUGIN_TEMPLATE_KEYS]
+    if not all(type(value) is str for value in values):
+        return dumps_pretty(build_plugin_dict(data, params))
+    params_json = dumps_pretty(params).replace("\n", "\n    ")  # Nested two levels deep
+    return _PLUGIN_JSON_TEMPLATE % (*map(encode_basestring, values), params_json)
+
+def preview_params(text, loads=_json_loads):
+    """entrypoint_params parsed for a preview, or the text itself if it is not a JSON object or array"""
+    # Only an object or array is worth a parse attempt; anything else would just raise
+    if not isinstance(text, str) or text.lstrip()[:1] not in ("{", "["):
+        return text
+    try:
+        return loads(text)
+    except Exception:
+        return text
+
 class AddSkillDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Add New Skill")
         self.setMinimumWidth(500)
-        
-        # Set dialog icon
-        app_icon = get_app_icon()
-        if app_icon:
-            self.setWindowIcon(app_icon)
-
-        # Load config and INI for field locking and tooltips
-        config = load_app_config()
-        ini_lock = INI_CONFIG['SkillDefaults'].getboolean('lock_fields')
-        ini_tooltips = INI_CONFIG['SkillDefaults'].getboolean('show_tooltips')
-        allow_overwrite = INI_CONFIG['SkillDefaults'].getboolean('allow_overwrite')
+        self._params_cache = None  # (entrypoint_params text, parsed value) shared by Preview and Create
+
+        # INI drives field locking and tooltips
+        ini_lock = INI['SkillDefaults']['lock_fields']
+        ini_tooltips = INI['SkillDefaults']['show_tooltips']
+        allow_overwrite = INI['SkillDefaults']['allow_overwrite']
+        self._ini_tooltips = ini_tooltips
         self.layout = QVBoxLayout()
-        self.form_layout = QFormLayout()
+        self.form_layout = make_field_grid()
         self.fields = {}
 
-        for key in REQUIRED_FIELDS:
-            row_layout = QHBoxLayout()
+        for row, (key, description) in enumerate(_REQUIRED_ITEMS):
             le = QLineEdit()
-            le.setPlaceholderText(REQUIRED_FIELDS[key])
+            le.setPlaceholderText(description)
             le.setText(REVERSE_TEXT_SKILL_DEFAULTS.get(key, ""))
             le.setReadOnly(ini_lock)
-            # Add extra tooltip for entrypoint_file
-            if ini_tooltips:
-                if key == "entrypoint_file":
-                    extra_tip = "This file must live inside the same folder as plugin.json. Each skill has its own handler.js."
-                    le.setToolTip(REVERSE_TEXT_SKILL_TOOLTIPS.get(key, "") + "\n" + extra_tip)
-                else:
-                    le.setToolTip(REVERSE_TEXT_SKILL_TOOLTIPS.get(key, ""))
-            else:
-                le.setToolTip("")
+            le.setToolTip(field_tooltip(key) if ini_tooltips else "")
             self.fields[key] = le
-            row_layout.addWidget(le)
             # Info button
-            info_btn = QPushButton("ℹ️")
-            info_btn.setFixedWidth(28)
-            if ini_tooltips:
-                if key == "entrypoint_file":
-                    info_btn.setToolTip(REVERSE_TEXT_SKILL_TOOLTIPS.get(key, "") + "\n" + extra_tip)
-                else:
-                    info_btn.setToolTip(REVERSE_TEXT_SKILL_TOOLTIPS.get(key, ""))
-            else:
-                info_btn.setToolTip("")
-            info_btn.clicked.connect(lambda _, k=key: self.show_info(k))
-            row_layout.addWidget(info_btn)
-            self.form_layout.addRow(f"{key}:", row_layout)
+            info_btn = FieldInfoButton(key, show_tooltip=ini_tooltips)
+            info_btn.clicked.connect(self._on_info_clicked)
+            add_field_row(self.form_layout, row, key, le, info_btn)
 
         self.layout.addLayout(self.form_layout)
 
@@ -799,38 +1041,11 @@ class AddSkillDialog(QDialog):
         upper_btn_layout = QHBoxLayout()
         preview_btn = MenuBarButton("Preview")
         if ini_tooltips:
-            preview_btn.setToolTip("This file must live inside the same folder as plugin.json. Each skill has its own handler.js.")
+            preview_btn.setToolTip(ENTRYPOINT_FILE_TIP)
         else:
             preview_btn.setToolTip("")
         preview_btn.clicked.connect(self.preview_skill)
-        clear_btn = MenuBarButton("Clear Form")
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #0057b8;
-                border-radius: 6px;
-                padding: 6px 18px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3399ff, stop:1 #0057b8
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #66b3ff, stop:1 #0073e6
-                );
-            }
-            QPushButton:pressed {
-                background: #0057b8;
-            }
-            QPushButton:disabled {
-                background: #0057b8;
-                color: #bbbbbb;
-                border: 1.5px solid #0057b8;
-            }
-        """)
+        clear_btn = BlueButton("Clear Form")
         clear_btn.clicked.connect(self.clear_form)
         upper_btn_layout.addWidget(preview_btn)
         upper_btn_layout.addWidget(clear_btn)
@@ -838,70 +1053,14 @@ class AddSkillDialog(QDialog):
         self.layout.addLayout(upper_btn_layout)
 
         # Preview area
-        self.preview_area = QTextEdit()
-        self.preview_area.setReadOnly(False)
-        self.preview_area.setPlaceholderText("Preview of plugin.json will appear here...")
+        self.preview_area = make_preview_area(read_only=False)
         self.layout.addWidget(self.preview_area)
 
         # Create/Cancel buttons (below preview)
         lower_btn_layout = QHBoxLayout()
-        create_btn = MenuBarButton("Create")
-        create_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #0a0;
-                border-radius: 6px;
-                padding: 6px 18px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #44ff44, stop:1 #008800
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #66ff66, stop:1 #00bb00
-                );
-            }
-            QPushButton:pressed {
-                background: #008800;
-            }
-            QPushButton:disabled {
-                background: #008800;
-                color: #bbbbbb;
-                border: 1.5px solid #008800;
-            }
-        """)
+        create_btn = GreenButton("Create")
         create_btn.clicked.connect(self.confirm_create)
-        cancel_btn = MenuBarButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #a00;
-                border-radius: 6px;
-                padding: 6px 18px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff4444, stop:1 #a00000
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6666, stop:1 #c00000
-                );
-            }
-            QPushButton:pressed {
-                background: #a00000;
-            }
-            QPushButton:disabled {
-                background: #a00000;
-                color: #bbbbbb;
-                border: 1.5px solid #a00000;
-            }
-        """)
+        cancel_btn = RedButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
         lower_btn_layout.addWidget(create_btn)
         lower_btn_layout.addStretch()
@@ -910,32 +1069,36 @@ class AddSkillDialog(QDialog):
         self.setLayout(self.layout)
         self.allow_skill_overwrite = allow_overwrite
 
+    def _on_info_clicked(self):
+        self.show_info(self.sender().property("fieldKey"))
+
     def show_info(self, key):
-        ini_tooltips = INI_CONFIG['SkillDefaults'].getboolean('show_tooltips')
-        if ini_tooltips:
+        if self._ini_tooltips:
             QMessageBox.information(self, f"Info: {key}", REVERSE_TEXT_SKILL_TOOLTIPS.get(key, "No info available."))
         else:
             QMessageBox.information(self, f"Info: {key}", "No info available.")
 
     def confirm_create(self):
-        reply = QMessageBox.question(self, "Confirm Create", "Are you sure you want to create this skill?", QMessageBox.Yes | QMessageBox.No)
-        if reply == QMessageBox.Yes:
+        reply = QMessageBox.question(self, "Confirm Create", "Are you sure you want to create this skill?", _YES_NO)
+        if reply == _YES:
             self.create_skill()
 
     def create_skill(self):
-        config = load_app_config()
-        log_level = config.get("log_level", "Standard")
-        data = {}
-        errors = []
-        start_time = datetime.datetime.now()
+        config = get_app_config()  # Cached; only the output path is needed, and only here
+        start_time = time.perf_counter()
 
         # STEP 1: Validate and collect all field values
-        for key, field in self.fields.items():
-            val = field.text().strip()
-            if not val:
-                errors.append(f"'{key}' cannot be empty.")
-            else:
-                data[key] = val
+        data = {key: val for key, field in self.fields.items() if (val := field.text().strip())}
+        # Only look for the empty fields when some were dropped from data
+        errors = [] if len(data) == len(self.fields) else [
+            _EMPTY_FIELD_MSG(key) for key in self.fields if key not in data]
+        # Parse entrypoint_params up front so bad JSON never touches the filesystem
+        if "entrypoint_params" in data:
+            try:
+                params_json = self._parse_params(data["entrypoint_params"])
+                log_verbose("Parsed entrypoint_params", skill_data=data, action="JSON Parsing")
+            except json.JSONDecodeError as e:
+                errors.append(f"'entrypoint_params' is not valid JSON: {e}")
         if errors:
             log_verbose("Validation failed", skill_data=data, action="Validation", 
                        error="\n".join(errors))
@@ -959,58 +1122,29 @@ class AddSkillDialog(QDialog):
             os.makedirs(target_folder, exist_ok=True)
             log_verbose("Created skill folder", skill_data=data, action="Folder Creation")
 
-            # STEP 5: Parse entrypoint_params as JSON
-            try:
-                params_json = json.loads(data["entrypoint_params"])
-                log_verbose("Parsed entrypoint_params", skill_data=data, action="JSON Parsing")
-            except Exception as e:
-                log_verbose("Failed to parse entrypoint_params", skill_data=data, 
-                           action="JSON Parsing", error=e)
-                QMessageBox.critical(self, "Error", f"Invalid entrypoint_params JSON: {e}")
-                return
-
-            # STEP 6: Build plugin.json content
-            plugin_data = {
-                "active": True,
-                "hubId": data["hubId"],
-                "name": data["name"],
-                "schema": data["schema"],
-                "version": data["version"],
-                "description": data["description"],
-                "entrypoint": {
-                    "file": data["entrypoint_file"],
-                    "params": params_json
-                }
-            }
+            # STEP 5: Build plugin.json content
+            plugin_data = build_plugin_dict(data, params_json)
             log_verbose("Built plugin.json content", skill_data=plugin_data, action="JSON Building")
 
-            # STEP 7: Write plugin.json
-            with open(os.path.join(target_folder, "plugin.json"), "w") as f:
-                json.dump(plugin_data, f, indent=2)
+            # STEP 6: Write plugin.json
+            write_file_atomic(os.path.join(target_folder, "plugin.json"),
+                              encode_pretty(plugin_data))
             log_verbose("Wrote plugin.json", skill_data=plugin_data, action="File Writing")
 
-            # STEP 8: Get handler code from editable preview
+            # STEP 7: Get handler code from editable preview
             handler_code = self.preview_area.toPlainText().strip()
-            if not handler_code:
-                handler_code = """module.exports.runtime = {
-    handler: async function (params) {
-        const input = params.text || "";
-        const reversed = input.split("").reverse().join("");
-        return `Reversed: ${reversed}`;
-    }
-};"""
-            log_verbose("Prepared handler code", skill_data={"handler_code": handler_code}, 
+            handler_bytes = handler_code.encode("utf-8") if handler_code else HANDLER_JS_TEMPLATE
+            log_verbose("Prepared handler code", skill_data={"handler_code": handler_bytes.decode("utf-8")}, 
                        action="Handler Preparation")
 
-            # STEP 9: Write handler.js
+            # STEP 8: Write handler.js
             handler_path = os.path.join(target_folder, data["entrypoint_file"])
-            with open(handler_path, "w") as f:
-                f.write(handler_code)
+            write_file_atomic(handler_path, handler_bytes)
             log_verbose("Wrote handler.js", skill_data={"handler_path": handler_path}, 
                        action="Handler Writing")
 
-            # STEP 10: Log and notify success
-            duration = (datetime.datetime.now() - start_time).total_seconds()
+            # STEP 9: Log and notify success
+            duration = time.perf_counter() - start_time
             log_standard(f"Created skill: {data['hubId']} at {target_folder}")
             log_verbose("Skill creation completed", skill_data=plugin_data, 
                        action="Skill Creation", duration=duration)
@@ -1018,35 +1152,26 @@ class AddSkillDialog(QDialog):
             QMessageBox.information(self, "Success", f"Skill '{data['hubId']}' created.")
             # Refresh dropdown in main window if present
             if isinstance(self.parent(), SkillEditor):
-                self.parent().populate_skill_dropdown()
+                self.parent().invalidate_skill_dropdown()
             self.accept()
 
         except Exception as e:
-            duration = (datetime.datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             log_verbose("Exception during skill creation", skill_data=data, 
                        action="Skill Creation", duration=duration, error=e)
-            QMessageBox.critical(self, "Error", f"Failed to create skill:\n{str(e)}")
+            QMessageBox.critical(self, "Error", f"Failed to create skill:\n{e}")
+
+    def _parse_params(self, text):
+        """json.loads for entrypoint_params, reusing the last result while the text is unchanged"""
+        if self._params_cache is None or self._params_cache[0] != text:
+            self._params_cache = (text, _json_loads(text))
+        return self._params_cache[1]
 
     def preview_skill(self):
         data = {key: field.text().strip() for key, field in self.fields.items()}
+        params_obj = preview_params(data["entrypoint_params"], self._parse_params)
         try:
-            params_obj = json.loads(data["entrypoint_params"])
-        except Exception as e:
-            params_obj = data["entrypoint_params"]
-        try:
-            plugin_json = json.dumps({
-                "active": True,
-                "hubId": data["hubId"],
-                "name": data["name"],
-                "schema": data["schema"],
-                "version": data["version"],
-                "description": data["description"],
-                "output_description": data["output_description"],
-                "entrypoint": {
-                    "file": data["entrypoint_file"],
-                    "params": params_obj
-                }
-            }, indent=2)
+            plugin_json = preview_plugin_json(data, params_obj)
         except Exception as e:
             plugin_json = f"Error generating JSON: {e}"
         self.preview_area.setPlainText(plugin_json)
@@ -1064,20 +1189,21 @@ class ModifySkillDialog(QDialog):
         self.setWindowTitle("Modify Skill")
         self.setMinimumWidth(500)
         self.skill_folder = skill_folder
-        # Load config and INI for field locking and tooltips
-        config = load_app_config()
-        ini_lock = INI_CONFIG['SkillDefaults'].getboolean('lock_fields')
-        ini_tooltips = INI_CONFIG['SkillDefaults'].getboolean('show_tooltips')
+        self._preview_plugin_data = None  # plugin.json dict behind the current preview text
+        self._preview_stale = True  # No current preview, so Update stays disabled
+        # INI drives field locking and tooltips
+        ini_lock = INI['SkillDefaults']['lock_fields']
+        ini_tooltips = INI['SkillDefaults']['show_tooltips']
+        self._ini_tooltips = ini_tooltips
         self.layout = QVBoxLayout()
-        self.form_layout = QFormLayout()
+        self.form_layout = make_field_grid()
         self.fields = {}
         # Load plugin.json
         plugin_json_path = os.path.join(skill_folder, "plugin.json")
-        plugin_data = REVERSE_TEXT_SKILL_DEFAULTS.copy()
+        plugin_data = REVERSE_TEXT_SKILL_DEFAULTS  # Read-only; replaced by the parsed file when there is one
         if os.path.exists(plugin_json_path):
             try:
-                with open(plugin_json_path, "r", encoding="utf-8") as f:
-                    plugin_data = json.load(f)
+                plugin_data = read_json_file(plugin_json_path)
                 # Flatten entrypoint fields
                 if "entrypoint" in plugin_data:
                     plugin_data["entrypoint_file"] = plugin_data["entrypoint"].get("file", "handler.js")
@@ -1087,149 +1213,48 @@ class ModifySkillDialog(QDialog):
                     else:
                         plugin_data["entrypoint_params"] = str(params)
                 # Ensure all required fields are present for display
-                for key in REQUIRED_FIELDS:
+                for key in _REQUIRED_FIELD_ORDER:
                     if key not in plugin_data:
                         plugin_data[key] = ""
             except Exception:
                 pass
-        for key in REQUIRED_FIELDS:
-            row_layout = QHBoxLayout()
-            le = QLineEdit()
-            le.setPlaceholderText(REQUIRED_FIELDS[key])
+        for row, (key, description) in enumerate(_REQUIRED_ITEMS):
+            le = FocusNotifyLineEdit()
+            le.setPlaceholderText(description)
             le.setText(plugin_data.get(key, ""))
             le.setReadOnly(ini_lock)
-            if ini_tooltips:
-                if key == "entrypoint_file":
-                    extra_tip = "This file must live inside the same folder as plugin.json. Each skill has its own handler.js."
-                    le.setToolTip(REVERSE_TEXT_SKILL_TOOLTIPS.get(key, "") + "\n" + extra_tip)
-                else:
-                    le.setToolTip(REVERSE_TEXT_SKILL_TOOLTIPS.get(key, ""))
-            else:
-                le.setToolTip("")
+            le.setToolTip(field_tooltip(key) if ini_tooltips else "")
             self.fields[key] = le
-            row_layout.addWidget(le)
-            info_btn = QPushButton("ℹ️")
-            info_btn.setFixedWidth(28)
-            if ini_tooltips:
-                if key == "entrypoint_file":
-                    info_btn.setToolTip(REVERSE_TEXT_SKILL_TOOLTIPS.get(key, "") + "\n" + extra_tip)
-                else:
-                    info_btn.setToolTip(REVERSE_TEXT_SKILL_TOOLTIPS.get(key, ""))
-            else:
-                info_btn.setToolTip("")
-            info_btn.clicked.connect(lambda _, k=key: self.show_info(k))
-            row_layout.addWidget(info_btn)
-            self.form_layout.addRow(f"{key}:", row_layout)
-            # Connect focus event
-            le.installEventFilter(self)
+            info_btn = FieldInfoButton(key, show_tooltip=ini_tooltips)
+            info_btn.clicked.connect(self._on_info_clicked)
+            add_field_row(self.form_layout, row, key, le, info_btn)
+            # Editing any field invalidates the preview
+            le.focused.connect(self._invalidate_preview)
         self.layout.addLayout(self.form_layout)
         # Preview/Clear Form buttons (upper left above preview)
         upper_btn_layout = QHBoxLayout()
         preview_btn = MenuBarButton("Preview")
         if ini_tooltips:
-            preview_btn.setToolTip("This file must live inside the same folder as plugin.json. Each skill has its own handler.js.")
+            preview_btn.setToolTip(ENTRYPOINT_FILE_TIP)
         else:
             preview_btn.setToolTip("")
         preview_btn.clicked.connect(self.preview_skill)
-        clear_btn = MenuBarButton("Clear Form")
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #0057b8;
-                border-radius: 6px;
-                padding: 6px 18px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3399ff, stop:1 #0057b8
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #66b3ff, stop:1 #0073e6
-                );
-            }
-            QPushButton:pressed {
-                background: #0057b8;
-            }
-            QPushButton:disabled {
-                background: #0057b8;
-                color: #bbbbbb;
-                border: 1.5px solid #0057b8;
-            }
-        """)
+        clear_btn = BlueButton("Clear Form")
         clear_btn.clicked.connect(self.clear_form)
         upper_btn_layout.addWidget(preview_btn)
         upper_btn_layout.addWidget(clear_btn)
         upper_btn_layout.addStretch()
         self.layout.addLayout(upper_btn_layout)
         # Preview area
-        self.preview_area = QTextEdit()
-        self.preview_area.setReadOnly(False)
-        self.preview_area.setPlaceholderText("Preview of plugin.json will appear here...")
+        self.preview_area = make_preview_area(read_only=False)
         self.layout.addWidget(self.preview_area)
         # Update/Cancel buttons (below preview)
         lower_btn_layout = QHBoxLayout()
-        self.update_btn = MenuBarButton("Update")
-        self.update_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #0a0;
-                border-radius: 6px;
-                padding: 6px 18px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #44ff44, stop:1 #008800
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #66ff66, stop:1 #00bb00
-                );
-            }
-            QPushButton:pressed {
-                background: #008800;
-            }
-            QPushButton:disabled {
-                background: #008800;
-                color: #bbbbbb;
-                border: 1.5px solid #008800;
-            }
-        """)
+        self.update_btn = GreenButton("Update")
         self.update_btn.clicked.connect(self.confirm_update)
         self.update_btn.setEnabled(False)
         self.update_btn.setToolTip("Must view preview first")
-        cancel_btn = MenuBarButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #a00;
-                border-radius: 6px;
-                padding: 6px 18px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff4444, stop:1 #a00000
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6666, stop:1 #c00000
-                );
-            }
-            QPushButton:pressed {
-                background: #a00000;
-            }
-            QPushButton:disabled {
-                background: #a00000;
-                color: #bbbbbb;
-                border: 1.5px solid #a00000;
-            }
-        """)
+        cancel_btn = RedButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
         lower_btn_layout.addWidget(self.update_btn)
         lower_btn_layout.addStretch()
@@ -1237,30 +1262,36 @@ class ModifySkillDialog(QDialog):
         self.layout.addLayout(lower_btn_layout)
         self.setLayout(self.layout)
 
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.FocusIn:
-            if obj in self.fields.values():
-                self.update_btn.setEnabled(False)
-                self.update_btn.setToolTip("Must view preview first")
-                self.preview_area.clear()
-        return super().eventFilter(obj, event)
+    def _invalidate_preview(self):
+        # Only the first focus change after a preview has anything to undo; tabbing on is a no-op
+        if self._preview_stale:
+            return
+        self._preview_stale = True
+        self.update_btn.setEnabled(False)
+        self.update_btn.setToolTip("Must view preview first")
+        self.preview_area.clear()
+
+    def _on_info_clicked(self):
+        self.show_info(self.sender().property("fieldKey"))
 
     def show_info(self, key):
-        ini_tooltips = INI_CONFIG['SkillDefaults'].getboolean('show_tooltips')
-        if ini_tooltips:
+        if self._ini_tooltips:
             QMessageBox.information(self, f"Info: {key}", REVERSE_TEXT_SKILL_TOOLTIPS.get(key, "No info available."))
         else:
             QMessageBox.information(self, f"Info: {key}", "No info available.")
 
     def confirm_update(self):
-        reply = QMessageBox.question(self, "Confirm Update", "Are you sure you want to update this skill?", QMessageBox.Yes | QMessageBox.No)
-        if reply == QMessageBox.Yes:
+        reply = QMessageBox.question(self, "Confirm Update", "Are you sure you want to update this skill?", _YES_NO)
+        if reply == _YES:
             self.update_skill()
 
     def update_skill(self):
         # Use the JSON from the preview area
         try:
-            plugin_json = json.loads(self.preview_area.toPlainText())
+            if self._preview_plugin_data is not None and not self.preview_area.document().isModified():
+                plugin_json = self._preview_plugin_data
+            else:
+                plugin_json = _json_loads(self.preview_area.toPlainText())
         except Exception as e:
             log_verbose(
                 message="Preview JSON is invalid",
@@ -1272,21 +1303,21 @@ class ModifySkillDialog(QDialog):
         data = plugin_json
         errors = []
         # Validate top-level required fields
-        for key in ["name", "hubId", "description", "version", "schema"]:
+        for key in _TOP_LEVEL_REQUIRED_KEYS:
             if key not in data or not str(data[key]).strip():
-                errors.append(f"'{key}' cannot be empty.")
+                errors.append(_EMPTY_FIELD_MSG(key))
         # Validate entrypoint subfields
         if "entrypoint" not in data or not isinstance(data["entrypoint"], dict):
             errors.append("'entrypoint' must be a dictionary with 'file' and 'params'.")
         else:
             if not data["entrypoint"].get("file", "").strip():
-                errors.append("'entrypoint_file' cannot be empty.")
+                errors.append(_EMPTY_FIELD_MSG("entrypoint_file"))
             params = data["entrypoint"].get("params")
             if not params or (isinstance(params, str) and not params.strip()) or (isinstance(params, dict) and not params):
-                errors.append("'entrypoint_params' cannot be empty.")
+                errors.append(_EMPTY_FIELD_MSG("entrypoint_params"))
         # Validate output_description (if present at top level)
         if not data.get("output_description", "").strip():
-            errors.append("'output_description' cannot be empty.")
+            errors.append(_EMPTY_FIELD_MSG("output_description"))
         if errors:
             log_verbose(
                 message="Validation failed",
@@ -1313,7 +1344,7 @@ class ModifySkillDialog(QDialog):
                     action="Update",
                     error=str(e)
                 )
-                QMessageBox.critical(self, "Error", f"Could not create skill folder:\n{self.skill_folder}\n{str(e)}")
+                QMessageBox.critical(self, "Error", f"Could not create skill folder:\n{self.skill_folder}\n{e}")
                 return
         # Check if plugin.json exists and is writable
         if os.path.isfile(plugin_json_path) and not os.access(plugin_json_path, os.W_OK):
@@ -1326,8 +1357,7 @@ class ModifySkillDialog(QDialog):
             QMessageBox.critical(self, "Error", f"Cannot write to plugin.json (file may be locked or you lack permissions):\n{plugin_json_path}")
             return
         try:
-            with open(plugin_json_path, "w", encoding="utf-8") as f:
-                json.dump(plugin_json, f, indent=2)
+            write_file_atomic(plugin_json_path, encode_pretty(plugin_json))
             QMessageBox.information(self, "Success", f"Skill '{data['hubId']}' updated.")
             self.accept()
             # After dialog accepted, reset main window state
@@ -1341,7 +1371,7 @@ class ModifySkillDialog(QDialog):
                 action="Update",
                 error=str(e)
             )
-            QMessageBox.critical(self, "Error", f"Failed to update skill:\n{str(e)}")
+            QMessageBox.critical(self, "Error", f"Failed to update skill:\n{e}")
             # Clear Skill Loaded and disable Modify/Delete in main window
             parent = self.parent()
             if parent and hasattr(parent, 'show_skill_loaded'):
@@ -1354,27 +1384,17 @@ class ModifySkillDialog(QDialog):
 
     def preview_skill(self):
         data = {key: field.text().strip() for key, field in self.fields.items()}
+        params_obj = preview_params(data["entrypoint_params"])
         try:
-            params_obj = json.loads(data["entrypoint_params"])
-        except Exception as e:
-            params_obj = data["entrypoint_params"]
-        try:
-            plugin_json = json.dumps({
-                "active": True,
-                "hubId": data["hubId"],
-                "name": data["name"],
-                "schema": data["schema"],
-                "version": data["version"],
-                "description": data["description"],
-                "output_description": data["output_description"],
-                "entrypoint": {
-                    "file": data["entrypoint_file"],
-                    "params": params_obj
-                }
-            }, indent=2)
+            plugin_data = build_plugin_dict(data, params_obj)
+            plugin_json = preview_plugin_json(data, params_obj)
         except Exception as e:
+            plugin_data = None
             plugin_json = f"Error generating JSON: {e}"
         self.preview_area.setPlainText(plugin_json)
+        # Until the preview text is edited, update_skill can use this dict instead of re-parsing it
+        self._preview_plugin_data = plugin_data
+        self._preview_stale = False
         # Enable update button after preview
         self.update_btn.setEnabled(True)
         self.update_btn.setToolTip("")
@@ -1388,33 +1408,47 @@ class DeleteSkillDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Delete Skill")
         self.setMinimumWidth(500)
-        
-        # Set dialog icon
-        app_icon = get_app_icon()
-        if app_icon:
-            self.setWindowIcon(app_icon)
 
         self.skill_folder = skill_folder
+        self._delete_task = None  # DeleteDirTask while the folder is being removed
         self.layout = QVBoxLayout()
         self.layout.addWidget(QLabel(f"Are you sure you want to delete the skill in the folder: {skill_folder}?"))
         # Confirm/Cancel buttons
         btn_layout = QHBoxLayout()
-        confirm_btn = MenuBarButton("Confirm")
-        confirm_btn.clicked.connect(self.confirm_delete)
-        cancel_btn = MenuBarButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        btn_layout.addWidget(confirm_btn)
-        btn_layout.addWidget(cancel_btn)
+        self.confirm_btn = MenuBarButton("Confirm")
+        self.confirm_btn.clicked.connect(self.confirm_delete)
+        self.cancel_btn = MenuBarButton("Cancel")
+        self.cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(self.confirm_btn)
+        btn_layout.addWidget(self.cancel_btn)
         self.layout.addLayout(btn_layout)
         self.setLayout(self.layout)
 
     def confirm_delete(self):
-        try:
-            shutil.rmtree(self.skill_folder)
-            QMessageBox.information(self, "Success", f"Skill in folder '{self.skill_folder}' deleted.")
-            self.accept()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to delete skill:\n{str(e)}")
+        """Remove the folder on the thread pool so a large skill does not stall the UI"""
+        if self._delete_task is not None:
+            return
+        self.confirm_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(False)
+        task = DeleteDirTask(self.skill_folder)
+        task.signals.finished.connect(self._on_delete_finished, Qt.QueuedConnection)
+        self._delete_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_delete_finished(self, error):
+        self._delete_task = None
+        if error:
+            self.confirm_btn.setEnabled(True)
+            self.cancel_btn.setEnabled(True)
+            QMessageBox.critical(self, "Error", f"Failed to delete skill:\n{error}")
+            return
+        QMessageBox.information(self, "Success", f"Skill in folder '{self.skill_folder}' deleted.")
+        self.accept()
+
+    def reject(self):
+        # Esc and the close button must not dismiss the dialog while the delete is still running
+        if self._delete_task is None:
+            super().reject()
 
 class LoadSkillDialog(QDialog):
     def __init__(self, skill_folder, parent=None):
@@ -1423,129 +1457,61 @@ class LoadSkillDialog(QDialog):
         self.setMinimumWidth(500)
         self.skill_folder = skill_folder
         self.layout = QVBoxLayout()
-        self.form_layout = QFormLayout()
+        self.form_layout = make_field_grid()
         # Load plugin.json
         plugin_json_path = os.path.join(skill_folder, "plugin.json")
-        plugin_data = REVERSE_TEXT_SKILL_DEFAULTS.copy()
+        plugin_data = REVERSE_TEXT_SKILL_DEFAULTS  # Read-only; replaced by the parsed file when there is one
+        self.loaded_plugin_data = None  # plugin.json as parsed, before flattening
+        params_obj = None  # entrypoint params straight from plugin.json when they are an object
         if os.path.exists(plugin_json_path):
             try:
-                with open(plugin_json_path, "r", encoding="utf-8") as f:
-                    plugin_data = json.load(f)
+                plugin_data = read_json_file(plugin_json_path)
+                self.loaded_plugin_data = dict(plugin_data)
                 # Flatten entrypoint fields
                 if "entrypoint" in plugin_data:
                     plugin_data["entrypoint_file"] = plugin_data["entrypoint"].get("file", "handler.js")
                     params = plugin_data["entrypoint"].get("params", "")
                     if isinstance(params, dict):
+                        params_obj = params
                         plugin_data["entrypoint_params"] = json.dumps(params)
                     else:
                         plugin_data["entrypoint_params"] = str(params)
                 # Ensure all required fields are present for display
-                for key in REQUIRED_FIELDS:
+                for key in _REQUIRED_FIELD_ORDER:
                     if key not in plugin_data:
                         plugin_data[key] = ""
-            except Exception:
-                pass
+            except Exception as e:
+                self.loaded_plugin_data = {"error": str(e)}
         self.fields = {}
-        for key in REQUIRED_FIELDS:
-            row_layout = QHBoxLayout()
+        for row, (key, description) in enumerate(_REQUIRED_ITEMS):
             le = QLineEdit()
-            le.setPlaceholderText(REQUIRED_FIELDS[key])
+            le.setPlaceholderText(description)
             # Always set the value to the actual data, never just the placeholder
             le.setText(str(plugin_data.get(key, "")))
             le.setReadOnly(True)
             self.fields[key] = le
-            row_layout.addWidget(le)
             info_btn = QPushButton("ℹ️")
             info_btn.setFixedWidth(28)
             info_btn.setToolTip("Continue back to main screen to either modify or delete the chosen skill.")
-            info_btn.clicked.connect(lambda _, k=key: self.show_info(k))
-            row_layout.addWidget(info_btn)
-            self.form_layout.addRow(f"{key}:", row_layout)
+            info_btn.setProperty("fieldKey", key)
+            info_btn.clicked.connect(self._on_info_clicked)
+            add_field_row(self.form_layout, row, key, le, info_btn)
         self.layout.addLayout(self.form_layout)
         # Preview area
-        self.preview_area = QTextEdit()
-        self.preview_area.setReadOnly(True)
-        self.preview_area.setPlaceholderText("Preview of plugin.json will appear here...")
+        self.preview_area = make_preview_area(read_only=True)
+        # Params already parsed from plugin.json are used as-is instead of round-tripping the text
+        if params_obj is None:
+            params_obj = preview_params(plugin_data["entrypoint_params"])
         try:
-            params_obj = json.loads(plugin_data["entrypoint_params"])
-        except Exception as e:
-            params_obj = plugin_data["entrypoint_params"]
-        try:
-            plugin_json = json.dumps({
-                "active": True,
-                "hubId": plugin_data["hubId"],
-                "name": plugin_data["name"],
-                "schema": plugin_data["schema"],
-                "version": plugin_data["version"],
-                "description": plugin_data["description"],
-                "output_description": plugin_data["output_description"],
-                "entrypoint": {
-                    "file": plugin_data["entrypoint_file"],
-                    "params": params_obj
-                }
-            }, indent=2)
+            plugin_json = preview_plugin_json(plugin_data, params_obj)
         except Exception as e:
             plugin_json = f"Error generating JSON: {e}"
         self.preview_area.setPlainText(plugin_json)
         # Continue Load and Cancel buttons
         btn_layout = QHBoxLayout()
-        continue_btn = MenuBarButton("Continue Load")
-        continue_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #0a0;
-                border-radius: 6px;
-                padding: 4px 15px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #44ff44, stop:1 #008800
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #66ff66, stop:1 #00bb00
-                );
-            }
-            QPushButton:pressed {
-                background: #008800;
-            }
-            QPushButton:disabled {
-                background: #008800;
-                color: #bbbbbb;
-                border: 1.5px solid #008800;
-            }
-        """)
+        continue_btn = GreenButton("Continue Load", nav_size="compact")
         continue_btn.clicked.connect(self.continue_load)
-        cancel_btn = MenuBarButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #a00;
-                border-radius: 6px;
-                padding: 4px 15px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff4444, stop:1 #a00000
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6666, stop:1 #c00000
-                );
-            }
-            QPushButton:pressed {
-                background: #a00000;
-            }
-            QPushButton:disabled {
-                background: #a00000;
-                color: #bbbbbb;
-                border: 1.5px solid #a00000;
-            }
-        """)
+        cancel_btn = RedButton("Cancel", nav_size="compact")
         cancel_btn.clicked.connect(self.reject)
         btn_layout.addWidget(continue_btn)
         btn_layout.addWidget(cancel_btn)
@@ -1556,8 +1522,7 @@ class LoadSkillDialog(QDialog):
     def continue_load(self):
         # Enable Modify/Delete, disable Add in main window
         parent = self.parent()
-        config = load_app_config()
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             if parent and hasattr(parent, 'modify_btn') and hasattr(parent, 'delete_btn'):
                 if parent.modify_btn:
@@ -1567,21 +1532,16 @@ class LoadSkillDialog(QDialog):
                 if hasattr(parent, 'add_btn') and parent.add_btn:
                     parent.add_btn.setEnabled(False)
             # Verbose logging
-            if config.get("log_level", "Standard") == "Verbose":
-                try:
-                    with open(os.path.join(self.skill_folder, "plugin.json"), "r", encoding="utf-8") as f:
-                        plugin_data = json.load(f)
-                except Exception as e:
-                    plugin_data = {"error": str(e)}
-                duration = time.time() - start_time
+            if verbose_enabled():
+                duration = time.perf_counter() - start_time
                 log_verbose(
                     message="Skill loaded successfully.",
-                    skill_data=plugin_data,
+                    skill_data=self.loaded_plugin_data or {},
                     action="Skill Load",
                     duration=duration
                 )
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             log_verbose(
                 message="Error during skill load.",
                 skill_data={"skill_folder": self.skill_folder},
@@ -1591,6 +1551,9 @@ class LoadSkillDialog(QDialog):
             )
         self.accept()
 
+    def _on_info_clicked(self):
+        self.show_info(self.sender().property("fieldKey"))
+
     def show_info(self, key):
         QMessageBox.information(self, "Info", "Continue back to main screen to either modify or delete the chosen skill.")
 
@@ -1599,11 +1562,6 @@ class IconDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Change Application Icon")
         self.setMinimumWidth(400)
-        
-        # Set dialog icon if available
-        app_icon = get_app_icon()
-        if app_icon:
-            self.setWindowIcon(app_icon)
 
         layout = QVBoxLayout()
         
@@ -1612,7 +1570,7 @@ class IconDialog(QDialog):
         layout.addWidget(self.icon_label)
         
         # Icon path display
-        self.path_edit = QLineEdit(INI_CONFIG['Paths']['icon_path'])
+        self.path_edit = QLineEdit(INI['Paths']['icon_path'])
         self.path_edit.setReadOnly(True)
         layout.addWidget(self.path_edit)
         
@@ -1622,71 +1580,53 @@ class IconDialog(QDialog):
         layout.addWidget(browse_btn)
         
         # Close button
-        close_btn = MenuBarButton("Close")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #0057b8;
-                border-radius: 6px;
-                padding: 5px 17px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3399ff, stop:1 #0057b8
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #66b3ff, stop:1 #0073e6
-                );
-            }
-            QPushButton:pressed {
-                background: #0057b8;
-            }
-            QPushButton:disabled {
-                background: #0057b8;
-                color: #bbbbbb;
-                border: 1.5px solid #0057b8;
-            }
-        """)
+        close_btn = BlueButton("Close", nav_size="medium")
         close_btn.clicked.connect(self.accept)
         layout.addWidget(close_btn)
         
         self.setLayout(layout)
+        self._ini_dirty = False
+
+    def done(self, result):
+        # Accept, reject and the title bar close all end here, so icon changes are saved exactly once
+        if self._ini_dirty:
+            self._ini_dirty = False
+            try:
+                save_ini()
+            except OSError as e:
+                QMessageBox.critical(self, "Error", f"Failed to save icon setting: {e}")
+        super().done(result)
 
     def browse_icon(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Application Icon",
             "",
-            "Icon Files (*.ico);;All Files (*.*)"
+            "Icon Files (*.ico);;All Files (*.*)",
+            options=_FILE_DIALOG_OPTIONS
         )
         if file_path:
-            icons_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons')
-            if not os.path.exists(icons_dir):
-                os.makedirs(icons_dir)
+            icons_dir = os.path.join(_MODULE_DIR, 'icons')
+            os.makedirs(icons_dir, exist_ok=True)
             icon_filename = os.path.basename(file_path)
             target_path = os.path.join(icons_dir, icon_filename)
             try:
-                import shutil
+                old_icon = get_app_icon()
                 shutil.copy2(file_path, target_path)
                 self.path_edit.setText(f"icons/{icon_filename}")
                 INI_CONFIG['Paths']['icon_path'] = f"icons/{icon_filename}"
-                with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                                     "Anything_CustomSkill_Editor.ini"), 'w') as f:
-                    INI_CONFIG.write(f)
-                # Update icon immediately
-                new_icon = QIcon(target_path)
-                mw = self.parent()
-                if mw:
-                    mw.setWindowIcon(new_icon)
+                refresh_ini()
+                self._ini_dirty = True  # Written once when the dialog closes
+                # Update icon immediately; windows without their own icon follow the application's.
+                # Re-picking the same file gives back the same cached QIcon, so nothing is redrawn.
+                get_app_icon.cache_clear()
+                new_icon = get_app_icon()
+                if new_icon is not None and new_icon is not old_icon:
                     QApplication.setWindowIcon(new_icon)
-                self.setWindowIcon(new_icon)
                 QMessageBox.information(self, "Success", 
                     "Icon updated successfully. The new icon is now in use.")
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to copy icon file: {str(e)}")
+                QMessageBox.critical(self, "Error", f"Failed to copy icon file: {e}")
 
 class SkillSelectDialog(QDialog):
     def __init__(self, skills_dir, parent=None):
@@ -1697,27 +1637,13 @@ class SkillSelectDialog(QDialog):
         layout = QVBoxLayout()
         label = QLabel("Select a skill directory:")
         layout.addWidget(label)
-        self.list_widget = QListWidget()
-        valid_subdirs = []
-        if os.path.isdir(skills_dir):
-            for name in os.listdir(skills_dir):
-                subdir_path = os.path.join(skills_dir, name)
-                if os.path.isdir(subdir_path):
-                    plugin_json = os.path.join(subdir_path, "plugin.json")
-                    handler_js = os.path.join(subdir_path, "handler.js")
-                    if os.path.isfile(plugin_json) and os.path.isfile(handler_js):
-                        try:
-                            # Validate plugin.json is valid JSON
-                            with open(plugin_json, "r", encoding="utf-8") as f:
-                                pdata = json.load(f)
-                                # Validate required fields
-                                if all(key in pdata for key in ["name", "hubId", "description", "version", "schema"]):
-                                    valid_subdirs.append(name)
-                        except Exception:
-                            continue
-        for subdir in sorted(valid_subdirs, key=lambda s: s.lower()):
-            item = QListWidgetItem(subdir)
-            self.list_widget.addItem(item)
+        # Model/view list: only visible rows are laid out, however many skills there are
+        self.skills_dir = skills_dir
+        self.model = QStringListModel()
+        self.list_widget = QListView()
+        self.list_widget.setModel(self.model)
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.setEditTriggers(QListView.NoEditTriggers)
         layout.addWidget(self.list_widget)
         btn_layout = QHBoxLayout()
         load_btn = MenuBarButton("Load")
@@ -1728,79 +1654,116 @@ class SkillSelectDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
         layout.addLayout(btn_layout)
         self.setLayout(layout)
-        self.list_widget.itemDoubleClicked.connect(self.accept)
+        self.list_widget.doubleClicked.connect(self.accept)
+        # Scan after the dialog has painted
+        QTimer.singleShot(0, self._populate)
+
+    def _populate(self):
+        # Same validation and ordering as the main window's dropdown, and the same cached scan
+        self.model.setStringList([name for name, _ in scan_skills_dir(self.skills_dir)])
+
     def accept(self):
-        selected = self.list_widget.currentItem()
-        if selected:
-            self.selected_skill = selected.text()
+        index = self.list_widget.currentIndex()
+        if index.isValid():
+            self.selected_skill = self.model.data(index, Qt.DisplayRole)
             super().accept()
         else:
             QMessageBox.warning(self, "No Selection", "Please select a skill directory.")
 
+# Log files are opened once and kept open; writes are coalesced by the 64 KiB buffer.
+# Anything that reads or copies a log file calls flush_logs() first.
+_LOG_HANDLES = {}
+
+def _log_handle(path):
+    """Return the persistent append handle for a log file, opening it on first use"""
+    fh = _LOG_HANDLES.get(path)
+    if fh is None:
+        fh = _LOG_HANDLES[path] = open(path, "a", buffering=65536, encoding="utf-8")
+    return fh
+
+def flush_logs():
+    for fh in _LOG_HANDLES.values():
+        fh.flush()
+
+def close_logs():
+    for fh in _LOG_HANDLES.values():
+        fh.close()
+    _LOG_HANDLES.clear()
+
+def truncate_log(path):
+    """Empty a log file; its open handle is closed first and reopens on the next write"""
+    fh = _LOG_HANDLES.pop(path, None)
+    if fh is not None:
+        fh.close()
+    open(path, "w").close()
+
+atexit.register(close_logs)
+
+_now = datetime.datetime.now
+
+def _log_timestamp():
+    """'[YYYY-mm-dd HH:MM:SS.mmm] ' prefix, formatted by datetime's C isoformat"""
+    return f"[{_now().isoformat(sep=' ', timespec='milliseconds')}] "
+
 def log_standard(message):
     """Standard logging - just the essential information"""
-    with open(LOG_FILE_STANDARD, "a") as f:
-        f.write(f"[{datetime.datetime.now()}] {message}\n")
+    _log_handle(LOG_FILE_STANDARD).write(f"{_log_timestamp()}{message}\n")
+
+_VERBOSE_ENTRY_END = "\n" + "-" * 80 + "\n"  # Rule that closes each verbose log entry
 
 def log_verbose(message, skill_data=None, action=None, duration=None, error=None):
     """Enhanced verbose logging with detailed information"""
-    with open(LOG_FILE_VERBOSE, "a") as f:
-        timestamp = datetime.datetime.now()
-        log_parts = [f"[{timestamp}]"]
-        
-        # Add skill name if provided
-        if skill_data and isinstance(skill_data, dict) and "name" in skill_data:
-            log_parts.append(f"Skill: {skill_data['name']}")
-        
-        # Add action if provided
-        if action:
-            log_parts.append(f"Action: {action}")
-        
-        # Add duration if provided
-        if duration:
-            log_parts.append(f"Duration: {duration:.3f}s")
-        
-        # Add the main message
-        log_parts.append(f"Message: {message}")
-        
-        # Add detailed skill data if provided
-        if skill_data and isinstance(skill_data, dict):
-            log_parts.append("\nSkill Details:")
-            for key, value in skill_data.items():
-                if isinstance(value, dict):
-                    log_parts.append(f"  {key}:")
-                    for subkey, subvalue in value.items():
-                        log_parts.append(f"    {subkey}: {subvalue}")
-                else:
-                    log_parts.append(f"  {key}: {value}")
-        
-        # Add error information if provided
-        if error:
-            log_parts.append("\nError Details:")
-            if isinstance(error, Exception):
-                log_parts.append(f"  Type: {type(error).__name__}")
-                log_parts.append(f"  Message: {str(error)}")
-                import traceback
-                log_parts.append("Stack Trace:")
-                for line in traceback.format_tb(error.__traceback__):
-                    log_parts.append(f"    {line.strip()}")
+    if not _VERBOSE_ENABLED:
+        return
+    log_parts = [_log_timestamp().rstrip()]
+    append = log_parts.append
+    extend = log_parts.extend
+    has_skill_data = isinstance(skill_data, dict) and bool(skill_data)
+    
+    # Add skill name if provided
+    if has_skill_data and "name" in skill_data:
+        append(f"Skill: {skill_data['name']}")
+    
+    # Add action if provided
+    if action:
+        append(f"Action: {action}")
+    
+    # Add duration if provided
+    if duration:
+        append(f"Duration: {duration:.3f}s")
+    
+    # Add the main message
+    append(f"Message: {message}")
+    
+    # Add detailed skill data if provided
+    if has_skill_data:
+        append("\nSkill Details:")
+        for key, value in skill_data.items():
+            if isinstance(value, dict):
+                append(f"  {key}:")
+                extend([f"    {subkey}: {subvalue}" for subkey, subvalue in value.items()])
             else:
-                log_parts.append(f"  {error}")
-        
-        # Write the formatted log entry
-        f.write("\n".join(log_parts) + "\n" + "-"*80 + "\n")
+                append(f"  {key}: {value}")
+    
+    # Add error information if provided
+    if error:
+        append("\nError Details:")
+        if isinstance(error, BaseException):
+            append(f"  Type: {type(error).__name__}")
+            append(f"  Message: {error}")
+            append("Stack Trace:")
+            extend([f"    {line.strip()}" for line in traceback.format_tb(error.__traceback__)])
+        else:
+            append(f"  {error}")
+    
+    # Write the formatted log entry
+    entry = "\n".join(log_parts)
+    _log_handle(LOG_FILE_VERBOSE).write(f"{entry}{_VERBOSE_ENTRY_END}")
 
 def global_exception_hook(exc_type, exc_value, exc_traceback):
-    import traceback
-    log_verbose(
-        message="UNHANDLED EXCEPTION",
-        action="Global Exception",
-        error={
-            "type": exc_type.__name__,
-            "message": str(exc_value),
-            "stack": "".join(traceback.format_tb(exc_traceback))
-        }
-    )
+    # The exception itself goes to log_verbose, which only formats the traceback if verbose logging is on
+    log_verbose(message="UNHANDLED EXCEPTION", action="Global Exception", error=exc_value)
+    flush_logs()  # The process may not get to exit cleanly, so get the crash onto disk now
     # Also call the default excepthook so errors still show in console
     sys.__excepthook__(exc_type, exc_value, exc_traceback)
 
@@ -1808,9 +1771,16 @@ sys.excepthook = global_exception_hook
 
 def main():
     app = QApplication(sys.argv)
+    app.setStyleSheet(load_stylesheet())
+    app_icon = get_app_icon()
+    if app_icon:
+        app.setWindowIcon(app_icon)
     window = SkillEditor()
     window.show()
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    # A scan or delete may still be running on the pool; let it finish while its signal objects exist
+    QThreadPool.globalInstance().waitForDone()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
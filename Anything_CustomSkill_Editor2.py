@@ -4,92 +4,201 @@
 import sys
 import os
 import json
-import datetime
+import time
+import queue
+import logging
+import logging.handlers
+from types import MappingProxyType
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
                                QMenuBar, QMenu, QFileDialog, QDialog, QTextEdit, QLineEdit, QFormLayout,
                                QCheckBox, QComboBox, QMessageBox, QToolBar, QStatusBar)
 from PySide6.QtCore import Qt, QDateTime
 from PySide6.QtGui import QFont
 
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; the stdlib encoder is the fallback
+    _json_dumps = json.dumps
+
+# Button styling lives in one application-wide stylesheet file loaded in main(),
+# so Qt parses it once instead of once per button instance. Buttons pick their
+# look through the "navKind" property.
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Anything_CustomSkill_Editor2.qss")
+
+def load_stylesheet():
+    """Read the application stylesheet, or return an empty sheet if the file is missing"""
+    try:
+        with open(STYLESHEET_PATH, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+_BUTTON_FONT = None
+
+def _button_font():
+    """Shared bold button font, created on first use once a QApplication exists"""
+    global _BUTTON_FONT
+    if _BUTTON_FONT is None:
+        _BUTTON_FONT = QFont("Segoe UI", 10, QFont.Bold)
+    return _BUTTON_FONT
+
 class NavButton(QPushButton):
     """Navigation button class with glossy, pill-shaped black styling and sizing"""
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
+        self.setProperty("navKind", "pill")
         self.setMinimumSize(120, 35)  # Standard minimum size
-        self.setFont(QFont("Segoe UI", 10, QFont.Bold))  # Standard bold font
-        self.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 2px solid #222;
-                border-radius: 18px;
-                padding: 8px 30px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #444444, stop:0.5 #222222, stop:1 #000000
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #666666, stop:0.5 #333333, stop:1 #111111
-                );
-            }
-            QPushButton:pressed {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #222222, stop:1 #000000
-                );
-            }
-            QPushButton:disabled {
-                background: #222222;
-                color: #bbbbbb;
-                border: 2px solid #444444;
-            }
-        """)
+        self.setFont(_button_font())  # Standard bold font
 
 class MenuBarButton(QPushButton):
     """Menu bar button with rectangular styling and less-rounded corners"""
+    nav_kind = "menu"  # Stylesheet rule set the button is drawn with
+
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
+        self.setProperty("navKind", self.nav_kind)
         self.setMinimumSize(100, 32)
-        self.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        self.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #222;
-                border-radius: 6px;
-                padding: 6px 18px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #444, stop:1 #222
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #666, stop:1 #333
-                );
-            }
-            QPushButton:pressed {
-                background: #222;
-            }
-            QPushButton:disabled {
-                background: #333;
-                color: #bbb;
-                border: 1.5px solid #444;
-            }
-        """)
-
-LOG_DIR = os.path.expanduser("~/Documents/AnythingCustomSkillLogs")
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
+        self.setFont(_button_font())
+
+class RedButton(MenuBarButton):
+    """Menu bar button for Cancel/Close"""
+    nav_kind = "danger"
+
+LOG_DIR = os.path.expanduser("~/Documents/AnythingCustomSkillLogs")  # Created on first log write
 
 LOG_FILE_STANDARD = os.path.join(LOG_DIR, "custom_skill_log_standard.txt")
 LOG_FILE_VERBOSE = os.path.join(LOG_DIR, "custom_skill_log_verbose.txt")
 
-REQUIRED_FIELDS = {
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+LOG_FLUSH_INTERVAL = 0.1  # seconds of queue idle time before pending lines hit the disk
+LOG_FLUSH_MAX_CHARS = 64 * 1024  # a busy queue still flushes once this much text is pending...
+LOG_FLUSH_MAX_AGE = 1.0  # ...or once the oldest pending line has waited this many seconds
+VERBOSE_ENABLED = os.environ.get("CSE_VERBOSE") == "1"  # Set CSE_VERBOSE=1 to write the verbose log
+
+class _LogFormatter(logging.Formatter):
+    """Formatter that only runs strftime once per second and reuses the result"""
+    default_msec_format = "%s.%03d"
+
+    def __init__(self, fmt):
+        super().__init__(fmt)
+        self._last_second = None
+        self._last_stamp = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_stamp = time.strftime(self.default_time_format, self.converter(second))
+            self._last_second = second
+        return self.default_msec_format % (self._last_stamp, record.msecs)
+
+# Log calls only enqueue the record; a QueueListener thread started in main()
+# does the file I/O so the GUI thread never touches the disk.
+_LOG_QUEUE = queue.SimpleQueue()
+
+_LOG_FORMATTER = _LogFormatter("[%(asctime)s] %(message)s")
+
+_STD_LOGGER = logging.getLogger("skill_editor.standard")
+_VRB_LOGGER = logging.getLogger("skill_editor.verbose")
+_queue_handler = logging.handlers.QueueHandler(_LOG_QUEUE)
+for _logger in (_STD_LOGGER, _VRB_LOGGER):
+    _logger.setLevel(logging.INFO)
+    _logger.addHandler(_queue_handler)
+    _logger.propagate = False
+
+class _BatchedFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that holds formatted lines until flush() writes them in one call
+
+    The file is opened unbuffered in binary mode and its size is tracked in
+    memory, so each flush is exactly one write() on the raw file with no text
+    or buffering layers and no seek/tell in between.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = []
+        self._pending_chars = 0
+        self._pending_since = 0.0
+        self._size = 0
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        stream = open(self.baseFilename, "ab", buffering=0)
+        self._size = stream.tell()
+        return stream
+
+    def emit(self, record):
+        try:
+            line = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending.append(line)
+        self._pending_chars += len(line)
+        # The idle flush never fires while records keep arriving, so cap the batch by size and age
+        if (self._pending_chars >= LOG_FLUSH_MAX_CHARS
+                or time.monotonic() - self._pending_since >= LOG_FLUSH_MAX_AGE):
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            if not self._pending:
+                return
+            if self.stream is None:
+                self.stream = self._open()
+            data = "".join(self._pending).encode(self.encoding)
+            self._pending.clear()
+            self._pending_chars = 0
+            if self.maxBytes and self._size and self._size + len(data) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            # A raw write may take only part of the buffer; count what actually landed
+            view = memoryview(data)
+            while view:
+                written = self.stream.write(view)
+                self._size += written
+                view = view[written:]
+
+    def close(self):
+        self.flush()
+        super().close()
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue goes idle"""
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, timeout=LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+    def stop(self):
+        super().stop()
+        for handler in self.handlers:
+            handler.close()
+
+def _log_file_handler(path, logger):
+    """Batched rotating file handler that only accepts records from the given logger"""
+    handler = _BatchedFileHandler(
+        path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8", delay=True
+    )
+    handler.setFormatter(_LOG_FORMATTER)
+    handler.addFilter(logging.Filter(logger.name))
+    return handler
+
+_LOG_LISTENER = _BatchingQueueListener(
+    _LOG_QUEUE,
+    _log_file_handler(LOG_FILE_STANDARD, _STD_LOGGER),
+    _log_file_handler(LOG_FILE_VERBOSE, _VRB_LOGGER),
+)
+
+REQUIRED_FIELDS = MappingProxyType({
     "name": "The user-friendly name of the skill.",
     "hubId": "Internal skill ID. Must match folder name.",
     "description": "Short summary of what the skill does.",
@@ -98,95 +207,66 @@ REQUIRED_FIELDS = {
     "output_description": "What the skill will return. Must be a string.",
     "version": "Version of the skill, e.g., '1.0.0'.",
     "schema": "Must always be 'skill-1.0.0'."
-}
+})
+_REQUIRED_ITEMS = tuple(REQUIRED_FIELDS.items())
 
 class ConfigDialog(QDialog):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Default Configuration")
         self.resize(400, 600)  # Increased height for better usability
+        # Hold off repaints until every row is in place so the form lays out once
+        self.setUpdatesEnabled(False)
         self.layout = QFormLayout()
 
-        self.fields = {}
-        self.checkboxes = {}
-
-        for key, description in REQUIRED_FIELDS.items():
+        checkboxes = []
+        fields = []
+        for key, description in _REQUIRED_ITEMS:
             cb = QCheckBox(f"Lock '{key}' (default)")
             cb.setChecked(True)
             le = QLineEdit()
             le.setReadOnly(True)
             le.setPlaceholderText(description)
-            self.checkboxes[key] = cb
-            self.fields[key] = le
-            cb.stateChanged.connect(lambda state, k=key: self.toggle_field_edit(k, state))
+            checkboxes.append(cb)
+            fields.append(le)
+            cb.setProperty("fieldKey", key)
+            cb.stateChanged.connect(self._on_lock_toggled)
             self.layout.addRow(cb)
             self.layout.addRow(le)
+        self.checkboxes = dict(zip(REQUIRED_FIELDS, checkboxes))
+        self.fields = dict(zip(REQUIRED_FIELDS, fields))
+        self._field_items = tuple(self.fields.items())
 
         # Button layout for Save and Cancel
         btn_layout = QHBoxLayout()
         save_btn = MenuBarButton("Save")
         save_btn.clicked.connect(self.save_config)
-        cancel_btn = MenuBarButton("Cancel")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #a00;
-                border-radius: 6px;
-                padding: 6px 18px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff4444, stop:1 #a00000
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6666, stop:1 #c00000
-                );
-            }
-            QPushButton:pressed {
-                background: #a00000;
-            }
-            QPushButton:disabled {
-                background: #a00000;
-                color: #bbbbbb;
-                border: 1.5px solid #a00000;
-            }
-        """)
+        cancel_btn = RedButton("Cancel")
         cancel_btn.clicked.connect(self.reject)
         btn_layout.addWidget(save_btn)
         btn_layout.addWidget(cancel_btn)
         self.layout.addRow(btn_layout)
         self.setLayout(self.layout)
+        self.setUpdatesEnabled(True)
 
-    def toggle_field_edit(self, key, state):
-        self.fields[key].setReadOnly(state == Qt.Checked)
+    def _on_lock_toggled(self, state):
+        key = self.sender().property("fieldKey")
+        self.fields[key].setReadOnly(state == Qt.Checked.value)
 
     def save_config(self):
-        config = {}
-        errors = []
-
-        for key, field in self.fields.items():
-            val = field.text().strip()
-            config[key] = val
-            if not val:
-                errors.append(f"The field '{key}' cannot be empty.")
+        config = {key: field.text().strip() for key, field in self._field_items}
+        errors = [f"The field '{key}' cannot be empty." for key, val in config.items() if not val]
 
         if errors:
-            QMessageBox.critical(self, "Validation Error", "
-".join(errors))
+            QMessageBox.critical(self, "Validation Error", "\n".join(errors))
             return
 
         try:
-            with open(LOG_FILE_STANDARD, "a") as f:
-                f.write(f"[{datetime.datetime.now()}] Config saved: {json.dumps(config)}
-")
+            log_standard(f"Config saved: {_json_dumps(config)}")
             QMessageBox.information(self, "Saved", "Configuration saved.")
             self.accept()
         except Exception as e:
-            QMessageBox.critical(self, "File Error", f"Failed to save configuration.
-{str(e)}")
+            QMessageBox.critical(self, "File Error", f"Failed to save configuration.\n{str(e)}")
 
 
 class SkillEditor(QMainWindow):
@@ -194,6 +274,7 @@ class SkillEditor(QMainWindow):
         super().__init__()
         self.setWindowTitle("Anything Custom Skill Editor")
         self.setMinimumSize(800, 600)
+        self._config_dialog = None  # Built on first Tools click, then reused
 
         self.init_ui()
 
@@ -206,20 +287,19 @@ class SkillEditor(QMainWindow):
         tools_menu_btn.clicked.connect(self.open_tools_menu)
         toolbar.addWidget(tools_menu_btn)
 
-        # Nav Buttons (centered)
+        # Nav Buttons (centered by the stretches on either side)
         nav_layout = QHBoxLayout()
+        nav_layout.addStretch()
         for label in ["Add New", "Modify Skill", "Delete Skill", "Open Skills Directory"]:
             btn = NavButton(label)
             btn.clicked.connect(self.placeholder_popup)
             nav_layout.addWidget(btn)
-
-        nav_widget = QWidget()
-        nav_widget.setLayout(nav_layout)
+        nav_layout.addStretch()
 
         # Centering layout for nav buttons
         center_layout = QVBoxLayout()
         center_layout.addStretch()
-        center_layout.addWidget(nav_widget, alignment=Qt.AlignHCenter)
+        center_layout.addLayout(nav_layout)
         center_layout.addStretch()
 
         # Info label
@@ -234,34 +314,7 @@ class SkillEditor(QMainWindow):
         # Close button layout (lower right)
         close_btn_layout = QHBoxLayout()
         close_btn_layout.addStretch()
-        close_btn = MenuBarButton("Close")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                color: white;
-                font-weight: bold;
-                border: 1.5px solid #a00;
-                border-radius: 6px;
-                padding: 6px 18px;
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff4444, stop:1 #a00000
-                );
-            }
-            QPushButton:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff6666, stop:1 #c00000
-                );
-            }
-            QPushButton:pressed {
-                background: #a00000;
-            }
-            QPushButton:disabled {
-                background: #a00000;
-                color: #bbbbbb;
-                border: 1.5px solid #a00000;
-            }
-        """)
+        close_btn = RedButton("Close")
         close_btn.clicked.connect(self.close)
         close_btn_layout.addWidget(close_btn)
         main_layout.addLayout(close_btn_layout)
@@ -274,26 +327,33 @@ class SkillEditor(QMainWindow):
         self.setStatusBar(QStatusBar())
 
     def open_tools_menu(self):
-        dialog = ConfigDialog()
-        dialog.exec()
+        if self._config_dialog is None:
+            self._config_dialog = ConfigDialog()
+        self._config_dialog.exec()
 
     def placeholder_popup(self):
         QMessageBox.information(self, "Coming Soon", "This function is not yet implemented.")
 
 
 def log_standard(message):
-    with open(LOG_FILE_STANDARD, "a") as f:
-        f.write(f"[{datetime.datetime.now()}] {message}\n")
+    _STD_LOGGER.info(message)
 
 def log_verbose(message):
-    with open(LOG_FILE_VERBOSE, "a") as f:
-        f.write(f"[{datetime.datetime.now()}] {message}\n")
+    if not VERBOSE_ENABLED:
+        return
+    _VRB_LOGGER.info(message)
 
 def main():
     app = QApplication(sys.argv)
-    window = SkillEditor()
-    window.show()
-    sys.exit(app.exec())
+    app.setStyleSheet(load_stylesheet())
+    _LOG_LISTENER.start()
+    try:
+        window = SkillEditor()
+        window.show()
+        exit_code = app.exec()
+    finally:
+        _LOG_LISTENER.stop()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()